@@ -11,27 +11,98 @@ choose whether or not to use those arguments.
   object.
 * desc: A string description to display next to the progress bar.
 * plugin_name: Name of a specific plugin to use.
+* mininterval: When wrapping an iterable, the minimum number of seconds
+  between progress meter updates.
+* miniters: When wrapping an iterable, the minimum number of items between
+  progress meter updates (by default, this is tuned adaptively).
+
+Progress meters can be disabled entirely by setting the `POKROK_DISABLE`
+environment variable, or by selecting the 'null' plugin first (e.g.
+`set_plugins(['null'])`, or `"plugin_names": ["null"]` in the configuration
+file). The functions then return the original iterables, and
+`progress_meter()` returns a shared no-op progress meter.
 
 """
+from _thread import allocate_lock
 from collections.abc import Sized
-import json
-import math
+import importlib
+from itertools import islice
 import os
+import sys
+
+
+# Importing pokrok should be as cheap as possible, since many programs
+# import it but never show a progress meter. Submodules, the version (which
+# may require running git in a source checkout), and the singleton factory
+# are loaded on first access.
+_LAZY_ATTRS = {
+    'plugins': ('pokrok.plugins', None),
+    'styles': ('pokrok.styles', None),
+    'Style': ('pokrok.styles', 'Style'),
+    'Widget': ('pokrok.styles', 'Widget'),
+    'MultiProgress': ('pokrok.multi', 'MultiProgress'),
+    'SharedProgress': ('pokrok.shared', 'SharedProgress'),
+}
+
+
+DISABLE_ENV = 'POKROK_DISABLE'
+"""Environment variable that disables all progress meters when set to
+anything other than an empty string, '0', 'false' or 'no'. It is read once,
+when pokrok is imported."""
+
+_DISABLED = os.environ.get(DISABLE_ENV, '').lower() not in ('', '0', 'false', 'no')
+
+NULL_PLUGIN = 'null'
+"""Name of the plugin that disables progress meters when it is preferred."""
+
+NON_INTERACTIVE_PLUGIN = 'logging'
+"""Default plugin to use when stderr is not an interactive terminal."""
+
+NON_INTERACTIVE_OPTIONS = {'interval_seconds': 10}
+"""Default options for the plugin used when stderr is not an interactive
+terminal, so that progress is written as a line every few seconds rather
+than as frames. They are not used if the configured options or the call
+specify how often to log (`interval` or `interval_seconds`)."""
+
+
+def __getattr__(name):
+    if name == 'FACTORY':
+        return _get_factory()
+    elif name == '__version__':
+        from ._version import get_versions
+        value = get_versions()['version']
+    elif name in _LAZY_ATTRS:
+        module_name, attr = _LAZY_ATTRS[name]
+        value = importlib.import_module(module_name)
+        if attr:
+            value = getattr(value, attr)
+    else:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
 
-import pokrok.plugins
-import pokrok.styles
-from pokrok.styles import Style, Widget
 
-from ._version import get_versions
-__version__ = get_versions()['version']
-del get_versions
+def __dir__():
+    return sorted(
+        set(globals()) | set(_LAZY_ATTRS) | {'FACTORY', '__version__'})
 
 
 class ProgressFactory:
     def __init__(self):
-        self.plugins = pokrok.plugins.PluginManager()
-        self.styles = pokrok.styles.StyleManager()
+        import threading
+        from pokrok.plugins import PluginManager
+        from pokrok.styles import StyleManager
+        self.styles = StyleManager()
+        self.plugins = PluginManager(styles=self.styles)
         self.configured = False
+        self.disabled = _DISABLED
+        self.interactive = None
+        self.non_interactive_plugin = NON_INTERACTIVE_PLUGIN
+        self._stderr_isatty = None
+        self.pool = None
+        self.renderer = None
+        self._lock = threading.RLock()
 
     @property
     def default_paths(self):
@@ -44,42 +115,179 @@ class ProgressFactory:
 
     def configure(
             self, filename=None, plugin_names=None, exclusive=False,
-            styles=None, **kwargs):
+            styles=None, plugin_cache=None, prewarm=False, pool_size=None,
+            frame_rate=None, interactive=None, non_interactive_plugin=None,
+            **kwargs):
+        with self._lock:
+            self._configure(
+                filename, plugin_names, exclusive, styles, plugin_cache,
+                prewarm, pool_size, frame_rate, interactive,
+                non_interactive_plugin, **kwargs)
+
+    def _configure(
+            self, filename, plugin_names, exclusive, styles, plugin_cache,
+            prewarm, pool_size, frame_rate, interactive,
+            non_interactive_plugin, **kwargs):
+        # Any change in configuration may change which plugin is selected,
+        # and how progress meters are created
+        self.plugins.clear_cache()
+        if self.pool is not None:
+            self.pool.clear()
+        if plugin_cache:
+            self.plugins.cache_path = plugin_cache
+
         if not (filename or self.configured):
             for fname in self.default_paths:
                 if os.path.exists(fname):
                     filename = fname
                     break
+            # Only search the default paths once, even if no file is found
+            self.configured = True
 
         if filename:
-            config = None
-            if os.path.exists(filename):
-                with open(filename, 'rt') as inp:
-                    config = json.load(inp)
-            else:
-                try:
-                    package, path = filename.split(':')
-                    import pkg_resources as pr
-                    if pr.resource_exists(package, path):
-                        config = json.load(pr.resource_stream(package, path))
-                except:
-                    pass
+            config = _read_config(filename)
             if config is None:
                 raise ValueError("File not found: {}".format(filename))
-            self.plugins.set_plugin_options(config)
+            # Options in the file override those passed as keyword arguments
+            self.plugins.set_plugin_options(config, **kwargs)
             self.styles.set_style_options(config)
             self.configured = True
+            prewarm = prewarm or config.get('prewarm', False)
+            if pool_size is None:
+                pool_size = config.get('pool_size')
+            if frame_rate is None:
+                frame_rate = config.get('frame_rate')
+            if plugin_names is None:
+                plugin_names = config.get('plugin_names')
+                exclusive = exclusive or config.get('exclusive', False)
+            if interactive is None:
+                interactive = config.get('interactive')
+            if non_interactive_plugin is None:
+                # null disables switching plugins
+                non_interactive_plugin = config.get(
+                    'non_interactive_plugin', self.non_interactive_plugin) or False
+        elif kwargs:
+            self.plugins.set_plugin_options(**kwargs)
 
         if plugin_names:
-            self.plugins.load_plugins(plugin_names, exclusive)
-        if kwargs:
-            self.plugins.set_plugin_options(**kwargs)
+            # Preferring the null plugin disables progress meters without
+            # loading any plugins
+            self.disabled = _DISABLED or plugin_names[0] == NULL_PLUGIN
+            if not self.disabled:
+                self.plugins.load_plugins(plugin_names, exclusive)
         if styles:
             self.styles.update(**styles)
+        if interactive is not None:
+            self.interactive = interactive
+        if non_interactive_plugin is not None:
+            self.non_interactive_plugin = non_interactive_plugin
+        if pool_size is not None:
+            self.set_pool_size(pool_size)
+        if frame_rate is not None:
+            self.set_frame_rate(frame_rate)
+        if prewarm:
+            self.prewarm()
+
+    def set_pool_size(self, pool_size):
+        """Enable or disable reuse of finished progress meters. When enabled,
+        progress meters are pooled by plugin, style, and creation arguments,
+        and a finished progress meter is reset and handed out again instead
+        of creating a new one. A progress meter must not be used after it has
+        finished.
+
+        Args:
+            pool_size: The maximum number of idle progress meters to keep for
+                each combination of plugin, style and arguments, or 0 to
+                disable pooling.
+        """
+        from pokrok.plugins import ProgressMeterPool
+        with self._lock:
+            self.pool = ProgressMeterPool(pool_size) if pool_size else None
+
+    def set_frame_rate(self, frame_rate):
+        """Enable or disable background rendering. When enabled, calling
+        `increment()` on a progress meter only updates a counter, and a single
+        render thread updates all active progress meters `frame_rate` times
+        per second.
+
+        Args:
+            frame_rate: The number of frames per second, or 0 to disable
+                background rendering.
+        """
+        with self._lock:
+            if frame_rate:
+                from pokrok.render import RenderScheduler
+                self.renderer = RenderScheduler(frame_rate)
+            else:
+                self.renderer = None
+
+    def prewarm(self, plugin_name=None, sized=True, style='default'):
+        """Resolve the plugin that would be used for the specified
+        configuration and import its backend in a background (daemon)
+        thread, so that creating the first progress meter does not have to
+        pay the full import cost. If a progress meter is requested before
+        the import has finished, its creation waits for the import.
+
+        Args:
+            plugin_name: The name of a specific plugin to prewarm.
+            sized: Whether to prewarm the plugin that would be used for
+                sized (True) or unsized (False) progress meters.
+            style: The style that will be requested.
+
+        Returns:
+            The started thread.
+        """
+        import threading
+        thread = threading.Thread(
+            target=self._prewarm, args=(plugin_name, sized, style),
+            name='pokrok-prewarm', daemon=True)
+        thread.start()
+        return thread
+
+    def _prewarm(self, plugin_name, sized, style):
+        try:
+            # Resolving the plugin imports its backend
+            self._resolve(sized, style, plugin_name)
+        except Exception:
+            # Any error will resurface when a progress meter is created
+            pass
+
+    def is_interactive(self):
+        """Whether progress meters are displayed on an interactive terminal.
+        This is the configured `interactive` value, if any, otherwise whether
+        stderr is a TTY, which is only checked once.
+        """
+        if self.interactive is not None:
+            return self.interactive
+        if self._stderr_isatty is None:
+            try:
+                self._stderr_isatty = sys.stderr.isatty()
+            except (AttributeError, ValueError):
+                # No stderr, or it is closed
+                self._stderr_isatty = False
+        return self._stderr_isatty
+
+    def _resolve(self, sized, style, plugin_name):
+        if not self.configured:
+            self.configure()
+
+        if isinstance(style, str):
+            style = self.styles[style] if style else None
+
+        widgets = style.get_widgets(sized) if style else None
+        while True:
+            with self._lock:
+                plugin = self.plugins.resolve(sized, style, plugin_name)
+            if plugin is None or _load_backend(plugin):
+                return plugin, widgets
+            # The backend was found but cannot be imported (e.g. a broken
+            # install); fall back to the next plugin
+            with self._lock:
+                self.plugins.discard(plugin.name)
 
     def create(
             self, iterable=None, size=None, style='default', plugin_name=None,
-            **kwargs):
+            interactive=None, thread_safe=False, **kwargs):
         """Create a progress meter. All parameters are optional. The default
         behavior (i.e. when just calling `create()`) is to return an unsized
         ProgressMeter with default style.
@@ -90,6 +298,15 @@ class ProgressFactory:
                 progress meter.
             style: The desired style.
             plugin_name: The name of a specific plugin to use.
+            interactive: Whether the progress meter is displayed on an
+                interactive terminal, or None to use `is_interactive()`. If
+                not, and `plugin_name` is not specified, the
+                `non_interactive_plugin` (by default, 'logging' with
+                `NON_INTERACTIVE_OPTIONS`) is used if it is available.
+            thread_safe: Whether the progress meter may be incremented by
+                multiple threads concurrently (see
+                `pokrok.render.ThreadSafeProgressMeter`). Ignored when
+                wrapping an iterable.
             kwargs: Additional keyword arguments to pass to the plugin creation method.
 
         Returns:
@@ -100,40 +317,177 @@ class ProgressFactory:
             ProgressMeterError if a specific plugin is requested and is not
             available or does not support the requested configuration.
         """
-        if not self.configured:
-            self.configure()
-
-        if isinstance(style, str):
-            style = self.styles[style] if style else None
-
-        sized = size is not None
-        widgets = style.get_widgets(sized)
-
-        if plugin_name:
-            if not self.plugins.has_plugin(plugin_name):
-                raise ValueError(
-                    "Plugin {} is not supported".format(plugin_name))
-            plugin = self.plugins.get_plugin(plugin_name)
-            if not plugin.provides(sized, widgets, force=True):
-                raise ValueError(
-                    "Plugin {} does not support the requested configuration "
-                    "(sized={}, style={})".format(plugin_name, sized, widgets))
-        else:
-            plugin = self.plugins.get_first_plugin(sized, widgets)
-
-        if plugin and iterable:
+        if self.disabled or not self.configured and self._configure_disabled():
+            if iterable is not None:
+                return iterable
+            from pokrok.plugins.null import NULL_PROGRESS_METER
+            return NULL_PROGRESS_METER
+
+        defaults = None
+        if not plugin_name and self.non_interactive_plugin and not (
+                self.is_interactive() if interactive is None else interactive):
+            # Avoid writing frames (i.e. carriage returns) to a log file,
+            # unless the non-interactive plugin cannot provide the style
+            if self._provides(self.non_interactive_plugin, size is not None, style):
+                plugin_name = self.non_interactive_plugin
+                if plugin_name == NON_INTERACTIVE_PLUGIN:
+                    defaults = NON_INTERACTIVE_OPTIONS
+
+        plugin, widgets = self._resolve(size is not None, style, plugin_name)
+
+        if defaults:
+            kwargs = {**plugin.options, **kwargs}
+            if not ('interval' in kwargs or 'interval_seconds' in kwargs):
+                kwargs = {**defaults, **kwargs}
+        elif plugin and plugin.options:
+            # Configured options are defaults for the call's arguments
+            kwargs = {**plugin.options, **kwargs} if kwargs else plugin.options
+
+        pool = self.pool
+        renderer = self.renderer
+        # Wrapped iterables are consumed by a single thread
+        thread_safe = thread_safe and iterable is None
+        if plugin and (pool is not None or renderer is not None or thread_safe):
+            if iterable is not None:
+                # Wrap the iterable ourselves rather than using the plugin's
+                # iterate(), which creates its own (unpooled, non-deferred)
+                # progress meter
+                kwargs = dict(kwargs)
+                mininterval = kwargs.pop('mininterval', None)
+                miniters = kwargs.pop('miniters', None)
+            if pool is not None:
+                meter = self._create_pooled(pool, plugin, size, widgets, kwargs)
+            else:
+                meter = plugin.create(size=size, widgets=widgets, **kwargs)
+            if meter is not None and thread_safe:
+                from pokrok.render import ThreadSafeProgressMeter, get_scheduler
+                meter = ThreadSafeProgressMeter(meter, renderer or get_scheduler())
+            elif meter is not None and renderer is not None:
+                from pokrok.render import DeferredProgressMeter
+                meter = DeferredProgressMeter(meter, renderer)
+            if iterable is None:
+                return meter
+            elif meter is not None:
+                return _iterate_meter(meter, iterable, mininterval, miniters)
+
+        if plugin and iterable is not None:
             return plugin.iterate(
                 iterable, size=size, widgets=widgets, **kwargs)
         elif plugin:
             return plugin.create(size=size, widgets=widgets, **kwargs)
-        elif iterable:
+        elif iterable is not None:
             return iterable
         else:
             return None
 
+    def _provides(self, plugin_name, sized, style):
+        """Whether a plugin is available and can (at least if forced) provide
+        the specified style.
+        """
+        if isinstance(style, str):
+            style = self.styles[style] if style else None
+        with self._lock:
+            return (
+                self.plugins.has_plugin(plugin_name)
+                and self.plugins.capabilities(plugin_name, sized, style)[1])
+
+    def _configure_disabled(self):
+        """Applies the default configuration, and returns whether it disables
+        progress meters.
+        """
+        self.configure()
+        return self.disabled
+
+    def _create_pooled(self, pool, plugin, size, widgets, kwargs):
+        from pokrok.plugins import ProgressMeterError
+        kwargs = dict(kwargs)
+        reset_kwargs = dict(
+            size=size,
+            desc=kwargs.pop('desc', None),
+            start=kwargs.pop('start', None),
+            multiplier=kwargs.pop('multiplier', None))
+        try:
+            key = (plugin, size is not None, widgets, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            # Unhashable arguments; don't pool
+            key = None
+
+        if key is not None:
+            meter = pool.acquire(key)
+            if meter is not None:
+                try:
+                    meter.reset(**reset_kwargs)
+                    return meter
+                except ProgressMeterError:
+                    pass
+
+        meter = plugin.create(widgets=widgets, **reset_kwargs, **kwargs)
+        if key is not None and meter is not None:
+            pool.track(meter, key)
+        return meter
 
-# Singleton factory class
-FACTORY = ProgressFactory()
+
+def _load_backend(plugin):
+    """Imports the backend of a plugin that uses one, and returns whether it
+    could be imported.
+    """
+    load_module = getattr(plugin, '_load_module', None)
+    return load_module is None or load_module()
+
+
+_CONFIG_CACHE = {}
+"""Parsed configuration files, keyed by path. Each value is a tuple
+((mtime, size), config)."""
+
+
+def _read_config(filename):
+    """Read a JSON configuration file, reusing the parsed result as long as
+    the file is unchanged.
+
+    Args:
+        filename: The path of the file, or a "package:path" resource name.
+
+    Returns:
+        The configuration dict, or None if the file does not exist.
+    """
+    import json
+    path = os.path.expanduser(filename)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        try:
+            package, path = filename.split(':')
+            import pkg_resources as pr
+            if pr.resource_exists(package, path):
+                return json.load(pr.resource_stream(package, path))
+        except:
+            pass
+        return None
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, 'rt') as inp:
+        config = json.load(inp)
+    _CONFIG_CACHE[path] = (key, config)
+    return config
+
+
+# Singleton factory class, created on first use
+_FACTORY = None
+# (threading itself is not imported until the factory is needed)
+_FACTORY_LOCK = allocate_lock()
+
+
+def _get_factory():
+    global _FACTORY
+    if _FACTORY is None:
+        with _FACTORY_LOCK:
+            if _FACTORY is None:
+                _FACTORY = ProgressFactory()
+    return _FACTORY
 
 
 def set_plugins(names, exclusive=False):
@@ -143,7 +497,7 @@ def set_plugins(names, exclusive=False):
         names: Names of plugins to prefer, in order.
         exclusive: Whether the listed packages should be the only ones allowed.
     """
-    FACTORY.configure(plugin_names=names, exclusive=exclusive)
+    _get_factory().configure(plugin_names=names, exclusive=exclusive)
 
 
 def set_styles(**styles):
@@ -153,38 +507,73 @@ def set_styles(**styles):
         styles: keyword arguments, where the name is the style name and the
             value is a pokrok.styles.Style object.
     """
-    FACTORY.configure(styles=styles)
+    _get_factory().configure(styles=styles)
 
 
 def configure(**kwargs):
     """Low-level configuration. This is just a pass-through to
-    FACTORY.configure().
+    _get_factory().configure().
 
     Args:
         kwargs: Keyword arguments to pass to FACTORY.configure().
     """
-    FACTORY.configure(**kwargs)
+    _get_factory().configure(**kwargs)
+
+
+def prewarm(**kwargs):
+    """Import the backend of the preferred plugin in a background thread.
+    This is a pass-through to FACTORY.prewarm().
+
+    Args:
+        kwargs: Keyword arguments to pass to FACTORY.prewarm().
+
+    Returns:
+        The started thread.
+    """
+    return _get_factory().prewarm(**kwargs)
 
 
-def progress_range(start, stop=None, step=1, **kwargs):
-    """Iterate over a range while showing a progress bar.
+def progress_range(start, stop=None, step=1, mininterval=None, **kwargs):
+    """Iterate over a range while showing a progress bar. The range is
+    consumed in sub-ranges that are chained together in C, and the lengths
+    of the consumed sub-ranges are forwarded to the progress meter at most
+    once every `mininterval` seconds, so iteration has no per-item overhead
+    beyond that of iterating the range itself (see
+    `pokrok.plugins.iterate_meter`).
 
     Args:
         start: Range start.
         stop: Range stop.
         step: Range step.
+        mininterval: Minimum number of seconds between progress meter
+            updates.
         kwargs: Additional arguments - see package documentation.
 
     Returns:
         An iterable.
     """
-    if stop is not None:
-        r = range(start, stop, step)
-        size = math.ceil((stop - start) / step)
-    else:
-        r = range(start)
-        size = start
-    return progress_iter(r, size=size, **kwargs)
+    r = range(start, stop, step) if stop is not None else range(start)
+    if _disabled():
+        return r
+    meter = _get_factory().create(size=len(r), **kwargs)
+    if meter is None:
+        return r
+    return _iterate_meter(meter, r, mininterval, None)
+
+
+def _disabled():
+    """Whether progress meters are disabled. If the configuration has not
+    been applied, this applies it, but it does not load any plugins.
+    """
+    if _DISABLED:
+        return True
+    factory = _get_factory()
+    return factory.disabled or not factory.configured and factory._configure_disabled()
+
+
+def _iterate_meter(meter, iterable, mininterval, miniters):
+    from pokrok.plugins import iterate_meter
+    return iterate_meter(meter, iterable, mininterval, miniters)
 
 
 def progress_file(filename, mode, **kwargs):
@@ -199,7 +588,10 @@ def progress_file(filename, mode, **kwargs):
         Lines from the file.
     """
     with open(filename, mode) as f:
-        yield from progress_iter(f, **kwargs)
+        if _disabled():
+            yield from f
+        else:
+            yield from progress_iter(f, **kwargs)
 
 
 def progress_iter(iterable, size=None, **kwargs):
@@ -217,9 +609,102 @@ def progress_iter(iterable, size=None, **kwargs):
     """
     if iterable is None:
         raise ValueError("Invalid iterable")
+    if _DISABLED:
+        return iterable
+    if size is None and isinstance(iterable, Sized):
+        size = len(iterable)
+    return _get_factory().create(iterable=iterable, size=size, **kwargs)
+
+
+async def progress_aiter(aiterable, size=None, **kwargs):
+    """Wrap an asynchronous iterable in a progress bar. The progress meter
+    never blocks the event loop: it is created, started and finished in the
+    default executor, and each item only increments a counter, which a
+    background thread forwards to the progress meter (see `pokrok.render`).
+
+    Args:
+        aiterable: The asynchronous iterable to wrap.
+        size: The number of items that will be iterated over by the iterable.
+            If None and this iterable happens to be Sized, the size will be
+            determined using `len`.
+        kwargs: Additional arguments - see package documentation.
+
+    Yields:
+        The items of `aiterable`.
+    """
+    if aiterable is None:
+        raise ValueError("Invalid iterable")
+    if _disabled():
+        async for item in aiterable:
+            yield item
+        return
+    if size is None and isinstance(aiterable, Sized):
+        size = len(aiterable)
+    kwargs.pop('mininterval', None)
+    kwargs.pop('miniters', None)
+
+    # Creating the progress meter may load the plugins and import the
+    # plugin's backend
+    from pokrok.plugins import _run_in_executor
+    meter = await _run_in_executor(_create, size, kwargs)
+    if meter is None:
+        async for item in aiterable:
+            yield item
+        return
+
+    from pokrok.render import (
+        DeferredProgressMeter, ThreadSafeProgressMeter, get_scheduler)
+    if not isinstance(meter, (DeferredProgressMeter, ThreadSafeProgressMeter)):
+        meter = DeferredProgressMeter(meter, get_scheduler())
+    async with meter:
+        increment = meter.increment
+        async for item in aiterable:
+            yield item
+            increment()
+
+
+def _create(size, kwargs):
+    return _get_factory().create(size=size, **kwargs)
+
+
+def progress_batches(iterable, batch_size, size=None, container=list, **kwargs):
+    """Iterate over an iterable in batches while showing a progress bar. The
+    progress meter is incremented once per batch, by the number of items in
+    the batch.
+
+    Args:
+        iterable: The iterable to wrap.
+        batch_size: The maximum number of items in each batch. Only the last
+            batch may be smaller.
+        size: The number of items (not batches) that will be iterated over by
+            the iterable. If None and this iterable happens to be Sized, the
+            size will be determined using `len`.
+        container: The type of each batch, e.g. list or tuple.
+        kwargs: Additional arguments - see package documentation.
+
+    Yields:
+        Batches of items from the iterable.
+    """
+    if iterable is None:
+        raise ValueError("Invalid iterable")
+    if batch_size < 1:
+        raise ValueError("Invalid batch size: {}".format(batch_size))
     if size is None and isinstance(iterable, Sized):
         size = len(iterable)
-    return FACTORY.create(iterable=iterable, size=size, **kwargs)
+
+    itr = iter(iterable)
+    batches = iter(lambda: container(islice(itr, batch_size)), container())
+    if _disabled():
+        yield from batches
+        return
+    meter = _get_factory().create(size=size, **kwargs)
+    if meter is None:
+        yield from batches
+    else:
+        with meter:
+            for batch in batches:
+                yield batch
+                meter.increment(len(batch))
 
 
 def progress_meter(**kwargs):
@@ -232,4 +717,7 @@ def progress_meter(**kwargs):
     Returns:
         A ProgressMeter.
     """
-    return FACTORY.create(**kwargs)
+    if _DISABLED:
+        from pokrok.plugins.null import NULL_PROGRESS_METER
+        return NULL_PROGRESS_METER
+    return _get_factory().create(**kwargs)
@@ -0,0 +1,233 @@
+"""Display of multiple concurrent progress meters, one per terminal row.
+"""
+from collections.abc import Sized
+import heapq
+import shutil
+import sys
+import threading
+import time
+
+from pokrok.plugins import DEFAULT_MININTERVAL, ProgressMeterError
+
+
+CURSOR_UP = '\x1b[{}A'
+CURSOR_DOWN = '\x1b[{}B'
+CLEAR_LINE = '\x1b[K'
+
+
+class MultiProgress:
+    """
+    Owns a group of progress meters, each drawn on its own terminal row,
+    using a plugin that can position its progress meters (see
+    `ProgressMeterFactory.positionable`).
+
+    For plugins that render lines of text (e.g. 'ansi'), the MultiProgress
+    draws the rows itself: a progress meter only hands over its line when it
+    has changed, and changed rows are collected and redrawn together, at most
+    once every `mininterval` seconds, in a single write. Rows that have not
+    changed are never redrawn, so the cost of a frame is proportional to the
+    number of changed rows, not to the total number of rows. Other plugins
+    (e.g. 'tqdm') are told which row to draw on.
+
+    Finished rows hold no state. With `leave=False`, the row of a finished
+    progress meter is reused by the next progress meter that is added.
+
+    If progress meters are disabled (see `pokrok.plugins.null`), `add`
+    returns the null progress meter and `iterate` returns the original
+    iterable. If progress meters are not displayed on an interactive
+    terminal (see `ProgressFactory.is_interactive`) and no plugin is
+    specified, rows are not drawn; each progress meter is created as by
+    `pokrok.progress_meter`, which by default writes lines to the log.
+
+    Args:
+        plugin_name: The name of the plugin to use, or None to use the first
+            positionable plugin.
+        stream: The stream to write to (default: sys.stderr).
+        mininterval: Minimum number of seconds between redraws.
+        leave: Whether to keep finished progress meters on their rows, or
+            reuse their rows for new progress meters.
+        height: Number of terminal rows (default: the height of the terminal).
+            Rows that have scrolled out of view are not redrawn.
+        interactive: Whether progress meters are displayed on an interactive
+            terminal, or None to use `ProgressFactory.is_interactive()`.
+
+    Raises:
+        ProgressMeterError if there is no positionable plugin, or the
+        requested plugin is not positionable.
+
+    Examples:
+        with MultiProgress() as multi:
+            meters = [multi.add(size=len(job), desc=job.name) for job in jobs]
+            ...
+    """
+
+    def __init__(
+            self, plugin_name=None, stream=None,
+            mininterval=DEFAULT_MININTERVAL, leave=True, height=None,
+            interactive=None):
+        from pokrok import _disabled, _get_factory
+        factory = _get_factory()
+        self.disabled = _disabled()
+        if interactive is None and not self.disabled:
+            interactive = factory.is_interactive()
+        # As in ProgressFactory.create, an explicitly requested plugin is
+        # always used
+        self.interactive = bool(
+            interactive or plugin_name or not factory.non_interactive_plugin)
+        if self.interactive and not self.disabled:
+            plugin_name = _positionable_plugin(factory.plugins, plugin_name)
+
+        self.plugin_name = plugin_name
+        self.stream = stream or sys.stderr
+        self.mininterval = mininterval
+        self.leave = leave
+        self.height = height or shutil.get_terminal_size().lines
+        self._factory = factory
+        self._lock = threading.Lock()
+        # Number of rows allocated, and number of rows that exist on the
+        # terminal; the cursor rests at the start of the line below them
+        self._rows = 0
+        self._drawn = 0
+        self._free = []
+        self._pending = {}
+        self._next_flush = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def add(self, size=None, style='default', **kwargs):
+        """Creates a progress meter on a new row.
+
+        Args:
+            size: The size of the progress meter, or None for an unsized
+                progress meter.
+            style: The desired style.
+            kwargs: Additional keyword arguments to pass to the plugin creation
+                method.
+
+        Returns:
+            A ProgressMeter.
+        """
+        if self.disabled:
+            from pokrok.plugins.null import NULL_PROGRESS_METER
+            return NULL_PROGRESS_METER
+        if not self.interactive:
+            return self._factory.create(
+                size=size, style=style, interactive=False, **kwargs)
+        plugin, widgets = self._factory._resolve(
+            size is not None, style, self.plugin_name)
+        if plugin.options:
+            kwargs = {**plugin.options, **kwargs}
+        with self._lock:
+            if self._free:
+                row = heapq.heappop(self._free)
+            else:
+                row = self._rows
+                self._rows += 1
+        return plugin.create(
+            size=size, widgets=widgets, position=row, leave=self.leave,
+            display=lambda line, finished: self._update(row, line, finished),
+            **kwargs)
+
+    def iterate(self, iterable, size=None, mininterval=None, miniters=None, **kwargs):
+        """Wraps an iterable with a progress meter on a new row.
+
+        Args:
+            iterable: The iterable to wrap.
+            size: The number of items that will be iterated over by the
+                iterable. If None and this iterable happens to be Sized, the
+                size will be determined using `len`.
+            mininterval: Minimum number of seconds between updates.
+            miniters: Minimum number of items between updates.
+            kwargs: Additional arguments - see `add`.
+
+        Returns:
+            An iterable.
+        """
+        from pokrok import _iterate_meter
+        if self.disabled:
+            return iterable
+        if size is None and isinstance(iterable, Sized):
+            size = len(iterable)
+        meter = self.add(size=size, **kwargs)
+        if meter is None:
+            return iterable
+        return _iterate_meter(meter, iterable, mininterval, miniters)
+
+    def refresh(self):
+        """Redraws any rows that have changed since the last redraw.
+        """
+        with self._lock:
+            self._flush(time.monotonic())
+
+    def close(self):
+        """Draws any pending changes. Progress meters that have not finished
+        are not drawn again.
+        """
+        self.refresh()
+
+    def _update(self, row, line, finished):
+        with self._lock:
+            if line is not None:
+                self._pending[row] = line
+            if finished:
+                if not self.leave:
+                    heapq.heappush(self._free, row)
+                self._flush(time.monotonic())
+            elif self._pending:
+                now = time.monotonic()
+                if now >= self._next_flush:
+                    self._flush(now)
+
+    def _flush(self, now):
+        self._next_flush = now + self.mininterval
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = {}
+
+        # Add lines for new rows, then visit the changed rows in order, moving
+        # the cursor relative to its current row
+        rows = self._rows
+        frame = ['\n' * (rows - self._drawn)]
+        self._drawn = rows
+        cursor = rows
+        first_visible = rows - self.height + 1
+        for row in sorted(pending):
+            if row < first_visible:
+                continue
+            if row < cursor:
+                frame.append(CURSOR_UP.format(cursor - row))
+            elif row > cursor:
+                frame.append(CURSOR_DOWN.format(row - cursor))
+            frame.append('\r' + pending[row] + CLEAR_LINE)
+            cursor = row
+        if cursor < rows:
+            frame.append(CURSOR_DOWN.format(rows - cursor))
+        frame.append('\r')
+        self.stream.write(''.join(frame))
+        self.stream.flush()
+
+
+def _positionable_plugin(plugins, plugin_name=None):
+    """Returns the name of the requested plugin, or of the first positionable
+    plugin if `plugin_name` is None.
+
+    Raises:
+        ProgressMeterError if there is no positionable plugin, or the
+        requested plugin is not positionable.
+    """
+    if plugin_name is None:
+        if plugins.plugins is None:
+            plugins.load_plugins()
+        for name, plugin in plugins.plugins.items():
+            if plugin.positionable:
+                return name
+        raise ProgressMeterError("No positionable plugin is available")
+    if not plugins.get_plugin(plugin_name).positionable:
+        raise ProgressMeterError(
+            "Plugin {} cannot position progress meters".format(plugin_name))
+    return plugin_name
@@ -1,10 +1,40 @@
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
+from collections.abc import Mapping
 import enum
 import importlib
+import importlib.util
+from itertools import chain
+import os
+import sys
+import threading
+import time
+from types import MappingProxyType
 from typing import Iterable, Optional
 
-from pkg_resources import iter_entry_points
+from pokrok.styles import widgets_mask
+
+
+ENTRY_POINT_GROUP = "pokrok"
+"""Name of the entry point group in which plugins are registered."""
+
+PLUGIN_CACHE_ENV = "POKROK_PLUGIN_CACHE"
+"""Environment variable giving the path of the plugin registry cache file."""
+
+DEFAULT_MININTERVAL = 0.1
+"""Default minimum number of seconds between progress meter updates when
+wrapping an iterable."""
+
+MAX_STRIDE = 1000
+"""Maximum number of items between checks of the clock when wrapping an
+iterable (unless `miniters` is larger), or when logging progress at a time
+interval. This bounds the time between updates of the progress meter if items
+become much slower to process after a fast phase."""
+
+RESERVED_OPTIONS = frozenset(
+    ('iterable', 'size', 'style', 'widgets', 'plugin_name', 'mod'))
+"""Arguments that are determined per call and so cannot be configured as
+plugin options."""
 
 
 # ProgressMeter statuses
@@ -19,17 +49,82 @@ class ProgressMeterError(Exception):
 
 
 class PluginManager:
-    def __init__(self):
+    """Discovers, orders, and hands out plugins.
+
+    Args:
+        cache_path: Path of a file in which to cache the discovered entry
+            points between runs, or None to read it from the
+            `POKROK_PLUGIN_CACHE` environment variable. If neither is set,
+            entry points are scanned every time plugins are loaded.
+        styles: Optional mapping of named styles (i.e. a StyleManager). When
+            plugins are loaded, the capability of each plugin to provide each
+            of these styles is precomputed.
+    """
+    def __init__(self, cache_path=None, styles=None):
         self.plugins = None
+        self.plugin_options = {}
+        self.cache_path = cache_path or os.environ.get(PLUGIN_CACHE_ENV)
+        self.styles = styles
+        self._capabilities = {}
+        self._resolved = {}
+
+    def clear_cache(self):
+        """Forgets all memoized plugin resolutions (see `resolve`).
+        """
+        self._resolved.clear()
+
+    def discard(self, name):
+        """Removes a plugin, e.g. because its backend turned out not to be
+        importable, and forgets all memoized plugin resolutions.
+
+        Args:
+            name: The plugin name.
+        """
+        if self.plugins:
+            self.plugins.pop(name, None)
+        self._resolved.clear()
 
     def set_plugin_options(self, config=None, **kwargs):
-        pass
+        """
+        Sets the default keyword arguments for one or more plugins. Options
+        are validated and merged with any previously set options once, here,
+        so that creating a progress meter only has to apply a ready dict.
+
+        Args:
+            config: A configuration dict. Options are read from its "plugins"
+                entry, which maps plugin names to dicts of options. These
+                override any options for the same plugin in `kwargs`.
+            kwargs: Plugin names mapped to dicts of options.
+
+        Raises:
+            ValueError if any of the options are invalid.
+        """
+        options = dict(
+            (name, _validate_plugin_options(name, plugin_options))
+            for name, plugin_options in kwargs.items()
+        )
+        if config and "plugins" in config:
+            if not isinstance(config["plugins"], Mapping):
+                raise ValueError(
+                    "'plugins' must map plugin names to options")
+            for name, plugin_options in config["plugins"].items():
+                plugin_options = _validate_plugin_options(name, plugin_options)
+                options[name] = dict(options.get(name, {}), **plugin_options)
+
+        for name, plugin_options in options.items():
+            self.plugin_options[name] = MappingProxyType(
+                dict(self.plugin_options.get(name, {}), **plugin_options))
+
+        if self.plugins:
+            for name, plugin in self.plugins.items():
+                if name in options:
+                    plugin.options = self.plugin_options[name]
 
     def load_plugins(self, names=None, exclusive=False):
         # Load the factory classes from the discovered entry points
         plugin_types = dict(
-            (entry_point.name, entry_point.load())
-            for entry_point in iter_entry_points(group="pokrok")
+            (name, _load_entry_point(value))
+            for name, value in find_entry_points(cache_path=self.cache_path)
         )
 
         # Filter and order if names are provided
@@ -45,14 +140,52 @@ class PluginManager:
 
         # Finally, only keep the plugins for which the underlying libraries
         # are installed
+        self._resolved.clear()
+        self._capabilities.clear()
         self.plugins = {}
         for name, plugin_type in plugin_types.items():
             plugin = plugin_type()
             if plugin.installed:
+                if name in self.plugin_options:
+                    plugin.options = self.plugin_options[name]
                 self.plugins[name] = plugin
 
+        if self.styles:
+            for style in set(self.styles.values()):
+                for name in self.plugins:
+                    self.capabilities(name, True, style)
+                    self.capabilities(name, False, style)
+
+    def capabilities(self, name, sized, style):
+        """
+        Returns whether a plugin can provide a progress meter in the specified
+        style. Results are stored in a plugin x style capability table.
+
+        Args:
+            name: The plugin name.
+            sized: Whether a sized progress meter is required.
+            style: A Style, or None for the plugin's default style.
+
+        Returns:
+            A tuple (strict, forced) of the results of the plugin's `provides`
+            method with force=False and force=True, respectively.
+        """
+        key = (name, sized, style)
+        try:
+            return self._capabilities[key]
+        except KeyError:
+            pass
+        plugin = self.plugins[name]
+        widgets = style.get_widgets(sized) if style else None
+        capabilities = (
+            plugin.provides(sized, widgets, force=False),
+            plugin.provides(sized, widgets, force=True)
+        )
+        self._capabilities[key] = capabilities
+        return capabilities
+
     def has_plugin(self, name):
-        if not self.plugins:
+        if self.plugins is None:
             self.load_plugins()
         return name in self.plugins
 
@@ -99,6 +232,196 @@ class PluginManager:
 
         return plugin
 
+    def resolve(self, sized, style=None, plugin_name=None):
+        """
+        Returns the plugin to use for the specified configuration. Results
+        are memoized until plugins are reloaded or `clear_cache` is called.
+
+        Args:
+            sized: Whether a sized ProgressMeter is required.
+            style: The desired Style.
+            plugin_name: The name of a specific plugin to use, or None to use
+                the first plugin that provides the configuration.
+
+        Returns:
+            A ProgressMeterFactory, or None if no plugin is available.
+
+        Raises:
+            ValueError if `plugin_name` is specified and that plugin is not
+            available or does not support the requested configuration.
+        """
+        key = (plugin_name, sized, style)
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+
+        if self.plugins is None:
+            self.load_plugins()
+
+        if plugin_name:
+            if not self.has_plugin(plugin_name):
+                raise ValueError(
+                    "Plugin {} is not supported".format(plugin_name))
+            if not self.capabilities(plugin_name, sized, style)[1]:
+                raise ValueError(
+                    "Plugin {} does not support the requested configuration "
+                    "(sized={}, style={})".format(plugin_name, sized, style))
+            plugin = self.plugins[plugin_name]
+        else:
+            # Prefer the first plugin that supports the requested style; if
+            # there is none, try again with force = True
+            plugin = None
+            for force in (0, 1):
+                for name in self.plugins:
+                    if self.capabilities(name, sized, style)[force]:
+                        plugin = self.plugins[name]
+                        break
+                if plugin is not None:
+                    break
+
+        self._resolved[key] = plugin
+        return plugin
+
+
+def _validate_plugin_options(name, options):
+    if not isinstance(options, Mapping):
+        raise ValueError(
+            "Options for plugin {} must be a dict, not {!r}".format(
+                name, options))
+    reserved = RESERVED_OPTIONS.intersection(options)
+    if reserved:
+        raise ValueError(
+            "Options {} cannot be configured for plugin {}".format(
+                ", ".join(sorted(reserved)), name))
+    mininterval = options.get("mininterval")
+    if mininterval is not None and not (
+            isinstance(mininterval, (int, float)) and mininterval >= 0):
+        raise ValueError(
+            "Invalid mininterval for plugin {}: {!r}".format(name, mininterval))
+    miniters = options.get("miniters")
+    if miniters is not None and not (
+            isinstance(miniters, int) and miniters >= 1):
+        raise ValueError(
+            "Invalid miniters for plugin {}: {!r}".format(name, miniters))
+    return options
+
+
+def find_entry_points(group=ENTRY_POINT_GROUP, cache_path=None):
+    """Finds the entry points registered in `group`.
+
+    Args:
+        group: The entry point group.
+        cache_path: Optional path of the registry cache file. The cache is
+            keyed by `sys.path` and the modification times of the installed
+            distributions' metadata directories, so it is invalidated
+            whenever a distribution is installed, upgraded, or removed.
+
+    Returns:
+        A list of (name, value) tuples, where value is the entry point's
+        object reference ("module:attr").
+    """
+    if not cache_path:
+        return _scan_entry_points(group)
+
+    fingerprint = _entry_point_fingerprint()
+    cached = _read_entry_point_cache(cache_path, group, fingerprint)
+    if cached is not None:
+        return cached
+
+    entry_points = _scan_entry_points(group)
+    _write_entry_point_cache(cache_path, group, fingerprint, entry_points)
+    return entry_points
+
+
+def _scan_entry_points(group):
+    from importlib.metadata import entry_points
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        eps = eps.select(group=group)
+    else:  # Python < 3.10
+        eps = eps.get(group, ())
+
+    # The same distribution can be visible more than once (e.g. when it is
+    # both installed and on the path as a source tree); keep the first.
+    seen = set()
+    result = []
+    for ep in eps:
+        if ep.name not in seen:
+            seen.add(ep.name)
+            result.append((ep.name, ep.value))
+    return result
+
+
+def _entry_point_fingerprint():
+    fingerprint = []
+    for path in sys.path:
+        path = path or os.curdir
+        try:
+            fingerprint.append([path, os.stat(path).st_mtime_ns])
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.endswith((".dist-info", ".egg-info")):
+                        fingerprint.append(
+                            [entry.name, entry.stat().st_mtime_ns])
+        except OSError:
+            continue
+    return fingerprint
+
+
+def _read_entry_point_cache(cache_path, group, fingerprint):
+    import json
+    try:
+        with open(cache_path, "rt") as inp:
+            cache = json.load(inp)
+        entry = cache[group]
+        if entry["fingerprint"] == fingerprint:
+            return [tuple(ep) for ep in entry["entry_points"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_entry_point_cache(cache_path, group, fingerprint, entry_points):
+    import json
+    try:
+        with open(cache_path, "rt") as inp:
+            cache = json.load(inp)
+        if not isinstance(cache, dict):
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    cache[group] = dict(
+        fingerprint=fingerprint,
+        entry_points=[list(ep) for ep in entry_points]
+    )
+    # Write to a temporary file and rename so that concurrent processes
+    # never see a partially written cache.
+    tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, "wt") as out:
+            json.dump(cache, out)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_entry_point(value):
+    module_name, _, attrs = value.partition(":")
+    obj = importlib.import_module(module_name.strip())
+    # Drop any extras specification, e.g. "module:attr [extra]"
+    attrs = attrs.split("[", 1)[0].strip()
+    if attrs:
+        for attr in attrs.split("."):
+            obj = getattr(obj, attr)
+    return obj
+
 
 class ProgressMeterFactory(metaclass=ABCMeta):
     """
@@ -106,6 +429,20 @@ class ProgressMeterFactory(metaclass=ABCMeta):
     a ProgressMeterFactory.
     """
 
+    options = MappingProxyType({})
+    """Default keyword arguments for `create` and `iterate`, as configured by
+    the user. Set by the PluginManager."""
+
+    positionable = False
+    """Whether the plugin can draw progress meters on a specific terminal row,
+    for use by `pokrok.MultiProgress`. The `create` method of a positionable
+    plugin accepts two additional keyword arguments: `position`, the row
+    index, and `display`, a callable that takes two arguments, `line` and
+    `finished`. If the plugin can render a progress meter as a line of text,
+    it must pass each changed line to `display` rather than drawing it;
+    otherwise, it draws the progress meter on row `position` itself, and
+    calls `display(None, True)` when the progress meter finishes."""
+
     @property
     @abstractmethod
     def name(self):
@@ -117,10 +454,12 @@ class ProgressMeterFactory(metaclass=ABCMeta):
     @abstractmethod
     def installed(self):
         """
-        Imports the package(s) depended upon by this module.
+        Checks whether the package(s) depended upon by this module are
+        available. This should be cheap; importing the packages should be
+        deferred until a progress meter is actually created.
 
         Returns:
-            True if all required packages are successfully imported.
+            True if all required packages are available.
         """
 
     @abstractmethod
@@ -222,20 +561,29 @@ class BaseProgressMeterFactory(ProgressMeterFactory, metaclass=ABCMeta):
                 meter with the specified parameters, even if it typically
                 would not.
         """
-        if not (widgets and self.style_superset):
+        return self.provides_mask(sized, widgets_mask(widgets), force)
+
+    def provides_mask(self, sized: bool, mask: int, force=False):
+        """
+        Same as `provides`, but with the requested widgets given as a bit mask
+        (see `pokrok.styles.widgets_mask`). Subclasses that support a
+        different set of configurations than is described by their
+        `style_superset` should override this method.
+        """
+        if not mask or self.style_superset is None:
             return True
 
-        provided_widgets = self.style_superset.get_widgets(sized)
-        if not provided_widgets:
+        provided_mask = self.style_superset.get_mask(sized)
+        if not provided_mask:
             return False
 
         # If trying to force the plugin to provide a progress meter, return True
         # if the plugin provides *any* of the requested widgets, otherwise require
         # that it provides *all* of the requested widgets.
         if force:
-            return len(set(widgets) & set(provided_widgets)) > 0
+            return (mask & provided_mask) != 0
         else:
-            return len(set(widgets) - set(provided_widgets)) == 0
+            return (mask & ~provided_mask) == 0
 
     def iterate(
         self,
@@ -246,24 +594,177 @@ class BaseProgressMeterFactory(ProgressMeterFactory, metaclass=ABCMeta):
         start=None,
         unit=None,
         multiplier=None,
+        mininterval: Optional[float] = None,
+        miniters: Optional[int] = None,
         **kwargs
     ):
+        """
+        Wraps an iterable with a progress meter. Rather than incrementing the
+        progress meter for every item, counts are accumulated locally and
+        forwarded at most once every `mininterval` seconds.
+
+        Args:
+            mininterval: Minimum number of seconds between updates of the
+                progress meter.
+            miniters: Minimum number of items between updates of the progress
+                meter. If None, this is tuned adaptively so that the clock is
+                only checked about once per `mininterval`.
+
+        See `ProgressMeterFactory.iterate` for the other arguments.
+        """
         pbar = self.create(size, widgets, desc, start, unit, multiplier, **kwargs)
-        if pbar:
-            with pbar:
-                for item in iterable:
-                    yield item
-                    pbar.increment()
-        else:
+        if not pbar:
             return iterable
+        return iterate_meter(pbar, iterable, mininterval, miniters)
+
+
+def iterate_meter(pbar, iterable, mininterval=None, miniters=None):
+    """
+    Wraps `iterable` with the progress meter `pbar`, which is started when
+    the iteration begins and finished when it ends, including when the
+    consumer stops early. Counts are forwarded to `pbar` in batches, at most
+    once every `mininterval` seconds.
+
+    Lists, tuples and ranges are consumed in slices that are chained together
+    in C, so there is no per-item overhead; other iterables are counted item
+    by item. Either way, the clock is only checked every `stride` items,
+    where the stride is tuned adaptively (up to MAX_STRIDE) unless
+    `miniters` is specified.
+
+    Args:
+        pbar: An unstarted ProgressMeter.
+        iterable: The iterable to wrap.
+        mininterval: Minimum number of seconds between updates of the
+            progress meter, or None for the default.
+        miniters: Minimum number of items between updates of the progress
+            meter, or None to tune the number adaptively.
+
+    Returns:
+        An iterator over the items of `iterable`.
+    """
+    if mininterval is None:
+        mininterval = DEFAULT_MININTERVAL
+    if isinstance(iterable, (list, tuple, range)):
+        return _SequenceIterator(
+            _sequence_chunks(pbar, iterable, mininterval, miniters))
+    return _iterate_items(pbar, iterable, mininterval, miniters)
+
+
+def _next_stride(stride, items, elapsed, mininterval):
+    """Returns the number of items to process before the next check of the
+    clock, given that the last `items` items took `elapsed` seconds. This
+    aims for one check per `mininterval`, but grows by at most a factor of 4
+    per check (in case the first items are much faster than the rest), and
+    is capped at MAX_STRIDE.
+    """
+    if elapsed > 0:
+        stride = min(stride * 4, int(items * mininterval / elapsed))
+    else:
+        stride *= 4
+    return max(1, min(stride, MAX_STRIDE))
+
+
+def _iterate_items(pbar, iterable, mininterval, miniters):
+    adaptive = not miniters
+    stride = miniters or 1
+    monotonic = time.monotonic
+    pending = 0
+    next_check = stride
+    with pbar:
+        increment = pbar.increment
+        last_update = last_check = monotonic()
+        try:
+            for item in iterable:
+                yield item
+                pending += 1
+                if pending >= next_check:
+                    now = monotonic()
+                    if now - last_update >= mininterval:
+                        increment(pending)
+                        pending = 0
+                        last_update = now
+                    if adaptive:
+                        stride = _next_stride(
+                            stride, stride, now - last_check, mininterval)
+                    last_check = now
+                    next_check = pending + stride
+        finally:
+            if pending:
+                increment(pending)
+
+
+class _SequenceIterator:
+    """Iterator over the items of a sequence, taken from a chain of slices
+    (see `_sequence_chunks`). Iterating it with `for` (or anything else that
+    calls `iter()`) consumes the chain directly, in C; `close()` stops the
+    iteration and finishes the progress meter, like closing a generator.
+    """
+    __slots__ = ('_chunks', '_items')
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._items = chain.from_iterable(chunks)
+
+    def __iter__(self):
+        return self._items
+
+    def __next__(self):
+        return next(self._items)
+
+    def close(self):
+        self._chunks.close()
+
+
+def _sequence_chunks(pbar, seq, mininterval, miniters):
+    """Yields iterators over consecutive slices of `seq`, incrementing `pbar`
+    by the length of each slice once it has been consumed. The length of the
+    sequence is checked before each slice, so items appended to a list during
+    the iteration are included, as they would be by iterating the list.
+    """
+    adaptive = not miniters
+    stride = miniters or 1
+    monotonic = time.monotonic
+    pending = 0
+    done = 0
+    itr = None
+    with pbar:
+        try:
+            last_update = last_check = monotonic()
+            while done < len(seq):
+                chunk = seq[done:done + stride]
+                itr = iter(chunk)
+                yield itr
+                itr = None
+                done += len(chunk)
+                pending += len(chunk)
+                now = monotonic()
+                if now - last_update >= mininterval:
+                    pbar.increment(pending)
+                    pending = 0
+                    last_update = now
+                if adaptive:
+                    stride = _next_stride(
+                        stride, len(chunk), now - last_check, mininterval)
+                last_check = now
+        finally:
+            if itr is not None:
+                # Stopped early; the most recent item was not completed
+                completed = len(chunk) - itr.__length_hint__() - 1
+                if completed > 0:
+                    pending += completed
+            if pending:
+                pbar.increment(pending)
 
 
 class DefaultProgressMeterFactory(BaseProgressMeterFactory):
     """
     Default implementation of ProgressMeterFactory. Assumes that a) the
     underlying package is in a module that can be imported using importlib
-    (if it is installed), b) the package supports any desired progress
-    meter configuration (override `provides` if this isn't true), and c)
+    (if it is installed) - the module is located without being imported
+    when checking whether the plugin is installed, and is only imported
+    when the first progress meter is created, b) the package supports any
+    desired progress meter configuration (override `provides` if this isn't
+    true), and c)
     the ProgressMeter subclass has a constructor with signature
     (module, size, widgets, desc, start, **kwargs).
 
@@ -281,6 +782,7 @@ class DefaultProgressMeterFactory(BaseProgressMeterFactory):
         self._name = name
         self._package = module_name or name
         self._module = None
+        self._module_lock = threading.Lock()
         self._progress_meter_class = progress_meter_class
         self._style_superset = style_superset
 
@@ -290,7 +792,12 @@ class DefaultProgressMeterFactory(BaseProgressMeterFactory):
 
     @property
     def installed(self):
-        return self._load_module()
+        if self._module is not None:
+            return self._module is not False
+        try:
+            return importlib.util.find_spec(self._package) is not None
+        except (ImportError, ValueError):
+            return False
 
     @property
     def style_superset(self):
@@ -320,16 +827,20 @@ class DefaultProgressMeterFactory(BaseProgressMeterFactory):
 
     def _load_module(self):
         if self._module is None:
-            try:
-                self._module = importlib.import_module(self._package)
-            except ImportError:
-                self._module = False
+            # The module may be imported concurrently by a prewarm thread
+            with self._module_lock:
+                if self._module is None:
+                    try:
+                        self._module = importlib.import_module(self._package)
+                    except ImportError:
+                        self._module = False
         return self._module not in (None, False)
 
 
 class ProgressMeter(metaclass=ABCMeta):
     """ProgressMeter interface to be implemented by the plugin.
     """
+    __slots__ = ()
 
     def __enter__(self):
         self.start()
@@ -338,6 +849,15 @@ class ProgressMeter(metaclass=ABCMeta):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.finish()
 
+    async def __aenter__(self):
+        # Starting and finishing may write to the terminal, so do it in the
+        # default executor rather than blocking the event loop
+        await _run_in_executor(self.start)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await _run_in_executor(self.finish)
+
     @property
     @abstractmethod
     def is_sized(self):
@@ -375,6 +895,24 @@ class ProgressMeter(metaclass=ABCMeta):
         """
         pass
 
+    def reset(self, size=None, desc=None, start=None, multiplier=None):
+        """Reset the progress meter so that it can be reused for a new task,
+        as if it had just been created with the given arguments (and the same
+        style and other arguments as originally). The progress meter should
+        not be started.
+
+        Args:
+            size: The new size, or None for an unsized progress meter.
+            desc: The new description.
+            start: The new counter start value.
+            multiplier: The new multiplier.
+
+        Raises:
+            ProgressMeterError if the progress meter cannot be reset.
+        """
+        raise ProgressMeterError(
+            "{} does not support reset".format(type(self).__name__))
+
     def _check_status(self, status=Status.STARTED, error=True):
         """Checks that the ProgressMeter's status matches `stats`.
 
@@ -404,14 +942,45 @@ class ProgressMeter(metaclass=ABCMeta):
         return True
 
 
+async def _run_in_executor(fn, *args):
+    import asyncio
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+
 class BaseProgressMeter(ProgressMeter, metaclass=ABCMeta):
     """Default implementation of ProgressMeter. Subclasses only need to
     implement `increment()`.
+
+    The state common to all progress meters is kept in a fixed set of slots
+    rather than an instance dict, which keeps large numbers of concurrent
+    progress meters small. Subclasses should declare `__slots__` for any
+    additional state.
+
+    Args:
+        size: The size of the progress meter, or None if it is unsized.
+        start: Counter start value.
+        multiplier: Multiplier for each counter increment.
+
+    Attributes:
+        size: The size of the progress meter.
+        count: The current counter value. Subclasses are responsible for
+            updating this in `increment()`.
+        multiplier: Multiplier for each counter increment, or None.
+        start_time: The value of `time.monotonic()` when the progress meter
+            was started, or None if it has not been started.
     """
+    __slots__ = (
+        'size', 'count', 'multiplier', 'start_time', '_status', '_pool',
+        '_pool_key')
 
-    def __init__(self, size=None):
+    def __init__(self, size=None, start=None, multiplier=None):
         self._status = Status.UNSTARTED
         self.size = size
+        self.count = start or 0
+        self.multiplier = multiplier
+        self.start_time = None
+        self._pool = None
+        self._pool_key = None
 
     @property
     def is_sized(self):
@@ -424,7 +993,90 @@ class BaseProgressMeter(ProgressMeter, metaclass=ABCMeta):
     def start(self):
         self._check_status(Status.UNSTARTED)
         self._status = Status.STARTED
+        self.start_time = time.monotonic()
 
     def finish(self):
+        """Marks the progress meter as finished. Subclasses should finish
+        their backend *before* calling this method, since a pooled progress
+        meter may be handed out again as soon as it has finished.
+        """
         self._check_status(Status.STARTED)
         self._status = Status.FINISHED
+        if self._pool is not None:
+            self._pool.release(self)
+
+    def _reset(self, size=None, start=None, multiplier=None):
+        """Resets the state common to all progress meters. Subclasses that
+        implement `reset` should call this method.
+        """
+        if self._status == Status.STARTED:
+            raise ProgressMeterError("Cannot reset a started ProgressMeter")
+        self._status = Status.UNSTARTED
+        self.size = size
+        self.count = start or 0
+        self.multiplier = multiplier
+        self.start_time = None
+
+
+class ProgressMeterPool:
+    """
+    A pool of finished progress meters that can be reset and reused, to avoid
+    the cost of creating a new backend object for each of many short tasks.
+    Progress meters are pooled by a key that identifies the plugin, style,
+    and any other arguments that cannot be changed by `ProgressMeter.reset`.
+    A progress meter must not be used after it has finished, since it may
+    have been handed out again.
+
+    Args:
+        maxsize: The maximum number of idle progress meters to keep per key.
+    """
+
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key):
+        """Takes an idle progress meter from the pool.
+
+        Args:
+            key: The pool key.
+
+        Returns:
+            A finished ProgressMeter that was created with `key`, or None.
+        """
+        with self._lock:
+            meters = self._idle.get(key)
+            return meters.pop() if meters else None
+
+    def track(self, meter, key):
+        """Arranges for a progress meter to be returned to the pool when it
+        finishes.
+
+        Args:
+            meter: The ProgressMeter.
+            key: The pool key.
+
+        Returns:
+            True if the progress meter can be pooled.
+        """
+        if not (isinstance(meter, BaseProgressMeter)
+                and type(meter).reset is not ProgressMeter.reset):
+            return False
+        meter._pool = self
+        meter._pool_key = key
+        return True
+
+    def release(self, meter):
+        """Returns a finished progress meter to the pool.
+        """
+        with self._lock:
+            meters = self._idle.setdefault(meter._pool_key, [])
+            if len(meters) < self.maxsize:
+                meters.append(meter)
+
+    def clear(self):
+        """Discards all idle progress meters.
+        """
+        with self._lock:
+            self._idle.clear()
@@ -0,0 +1,198 @@
+"""Built-in progress meter that draws directly to a terminal using ANSI
+escape sequences, with no third-party dependencies.
+
+Redraws are kept as cheap as possible: bar strings for every fill width are
+computed once, a frame is only formatted when the refresh interval has
+elapsed, it is only written if it differs from the previous frame, and each
+frame is emitted with a single `write` call.
+"""
+from functools import lru_cache
+import time
+
+from pokrok.plugins import (
+    DefaultProgressMeterFactory, BaseProgressMeter, ProgressMeterError, Status)
+from pokrok.styles import Style, Widget
+
+
+STYLE_SUPERSET = Style(
+    sized=[
+        Widget.SPINNER, Widget.BAR, Widget.PERCENT, Widget.COUNTER,
+        Widget.ELAPSED, Widget.ETA
+    ],
+    unsized=[Widget.SPINNER, Widget.COUNTER, Widget.ELAPSED]
+)
+
+DEFAULT_STYLE = Style(
+    sized=[Widget.PERCENT, Widget.BAR, Widget.COUNTER, Widget.ELAPSED, Widget.ETA],
+    unsized=[Widget.SPINNER, Widget.COUNTER, Widget.ELAPSED]
+)
+"""Widgets to use when no style is requested."""
+
+SPINNER_FRAMES = ('|', '/', '-', '\\')
+
+CLEAR_LINE = '\x1b[K'
+"""ANSI sequence that erases from the cursor to the end of the line."""
+
+
+class AnsiProgressMeterFactory(DefaultProgressMeterFactory):
+    positionable = True
+
+    def __init__(self):
+        # The only module required is sys, for the default output stream
+        super().__init__(
+            'ansi', AnsiProgressMeter, STYLE_SUPERSET, module_name='sys')
+
+
+@lru_cache(maxsize=None)
+def bar_strings(width, fill='#', empty=' '):
+    """Returns a tuple of the bar strings for every fill width from 0 to
+    `width`, inclusive.
+    """
+    return tuple(
+        '|' + fill * i + empty * (width - i) + '|'
+        for i in range(width + 1)
+    )
+
+
+def format_time(seconds):
+    """Formats a number of seconds as [h:]mm:ss.
+    """
+    minutes, seconds = divmod(int(seconds), 60)
+    if minutes < 60:
+        return '{:02d}:{:02d}'.format(minutes, seconds)
+    hours, minutes = divmod(minutes, 60)
+    return '{:d}:{:02d}:{:02d}'.format(hours, minutes, seconds)
+
+
+class AnsiProgressMeter(BaseProgressMeter):
+    """
+    Progress meter that draws a single line on a terminal.
+
+    Args:
+        stream: The stream to write to (default: sys.stderr).
+        bar_width: The number of characters in the bar widget.
+        mininterval: Minimum number of seconds between redraws.
+        display: Optional callable that is passed each changed line (and
+            whether the progress meter has finished) instead of the line
+            being written to `stream`. Used by `pokrok.MultiProgress`.
+    """
+    __slots__ = (
+        'mininterval', '_stream', '_display', '_widgets', '_desc', '_unit',
+        '_bars', '_frame', '_last_line', '_next_refresh')
+
+    def __init__(
+        self,
+        mod,
+        size,
+        widgets,
+        desc=None,
+        start=None,
+        unit=None,
+        multiplier=None,
+        stream=None,
+        bar_width: int = 20,
+        mininterval: float = 0.1,
+        display=None,
+        **_
+    ):
+        super().__init__(size, start, multiplier)
+        self.mininterval = mininterval
+        self._stream = stream or mod.stderr
+        self._display = display
+        sized = size is not None
+        if widgets is None:
+            widgets = DEFAULT_STYLE.get_widgets(sized)
+        else:
+            allowed = STYLE_SUPERSET.get_mask(sized)
+            widgets = tuple(w for w in widgets if w.bit & allowed)
+        self._widgets = widgets
+        self._desc = desc
+        self._unit = unit
+        self._bars = bar_strings(bar_width)
+        self._frame = 0
+        self._last_line = None
+        self._next_refresh = 0
+
+    def start(self):
+        super().start()
+        self.refresh()
+
+    def finish(self):
+        self._check_status(Status.STARTED)
+        self.refresh()
+        if self._display is None:
+            self._write('\n')
+        else:
+            self._display(None, True)
+        super().finish()
+
+    def reset(self, size=None, desc=None, start=None, multiplier=None):
+        if (size is None) != (self.size is None):
+            raise ProgressMeterError(
+                "Cannot change whether an ANSI progress meter is sized")
+        self._reset(size, start, multiplier)
+        self._desc = desc
+        self._frame = 0
+        self._last_line = None
+        self._next_refresh = 0
+
+    def increment(self, n=1):
+        if self._status is not Status.STARTED:
+            self._check_status(Status.STARTED)
+        if self.multiplier:
+            n *= self.multiplier
+        self.count += n
+        now = time.monotonic()
+        if now >= self._next_refresh:
+            self.refresh(now)
+
+    def refresh(self, now=None):
+        """Redraws the progress meter if its display has changed.
+        """
+        if now is None:
+            now = time.monotonic()
+        self._next_refresh = now + self.mininterval
+        line = self.format_line(now)
+        if line != self._last_line:
+            self._last_line = line
+            if self._display is None:
+                self._write('\r' + line + CLEAR_LINE)
+            else:
+                self._display(line, False)
+
+    def format_line(self, now=None):
+        """Formats the progress meter as a single line of text.
+        """
+        if now is None:
+            now = time.monotonic()
+        count = self.count
+        size = self.size
+        elapsed = now - self.start_time if self.start_time is not None else 0
+        fraction = min(max(count / size, 0), 1) if size else 0
+
+        parts = [self._desc + ':'] if self._desc else []
+        for widget in self._widgets:
+            if widget is Widget.BAR:
+                bars = self._bars
+                parts.append(bars[int(fraction * (len(bars) - 1))])
+            elif widget is Widget.PERCENT:
+                parts.append('{:3.0f}%'.format(fraction * 100))
+            elif widget is Widget.COUNTER:
+                counter = '{}/{}'.format(count, size) if size is not None else str(count)
+                parts.append(counter + ' ' + self._unit if self._unit else counter)
+            elif widget is Widget.ELAPSED:
+                parts.append(format_time(elapsed))
+            elif widget is Widget.ETA:
+                if count and size and elapsed:
+                    remaining = max(size - count, 0) * elapsed / count
+                    parts.append('ETA ' + format_time(remaining))
+                else:
+                    parts.append('ETA --:--')
+            elif widget is Widget.SPINNER:
+                parts.append(SPINNER_FRAMES[self._frame % len(SPINNER_FRAMES)])
+                self._frame += 1
+        return ' '.join(parts)
+
+    def _write(self, text):
+        self._stream.write(text)
+        self._stream.flush()
@@ -1,4 +1,8 @@
-from pokrok.plugins import DefaultProgressMeterFactory, BaseProgressMeter
+import threading
+import time
+
+from pokrok.plugins import DefaultProgressMeterFactory, BaseProgressMeter, Status
+from pokrok.render import RenderScheduler
 from pokrok.styles import Style, Widget
 
 
@@ -7,39 +11,119 @@ class HaloProgressMeterFactory(DefaultProgressMeterFactory):
         style_superset = Style(unsized=[Widget.SPINNER])
         super().__init__('halo', HaloProgressMeter, style_superset)
 
-    def iterate(
-            self, iterable, size=None, widgets=None, desc=None, start=None, unit=None,
-            multiplier=None, **kwargs
-    ):
-        if self._load_module():
-            with self._module.Halo(text=desc or ''):
-                yield from iterable
-        else:
-            yield from iterable
-
-    def provides(self, sized, widgets=None, force=False):
+    def provides_mask(self, sized, mask, force=False):
         if sized and not force:
             return False
-        if widgets:
+        if mask:
             if force:
-                return Widget.SPINNER in widgets
+                return (mask & Widget.SPINNER.bit) != 0
             else:
-                return len(widgets) == 1 and widgets[0] == Widget.SPINNER
+                return mask == Widget.SPINNER.bit
         return True
 
 
+_HALO_INTERNALS = ('_render_frame', '_check_stream', '_hide_cursor', '_interval')
+"""Private members of halo.Halo used to draw frames without the spinner's own
+thread. If any is missing, spinners are animated by halo itself."""
+
+_SCHEDULERS = {}
+_SCHEDULERS_LOCK = threading.Lock()
+
+_ACTIVE = []
+"""Active spinners that are animated by a scheduler, in the order in which
+they were started."""
+
+
+def get_scheduler(interval):
+    """Returns the shared RenderScheduler that animates spinners whose frame
+    interval is `interval` milliseconds.
+    """
+    scheduler = _SCHEDULERS.get(interval)
+    if scheduler is None:
+        with _SCHEDULERS_LOCK:
+            scheduler = _SCHEDULERS.get(interval)
+            if scheduler is None:
+                scheduler = _SCHEDULERS[interval] = RenderScheduler(
+                    1000 / interval)
+    return scheduler
+
+
 class HaloProgressMeter(BaseProgressMeter):
-    def __init__(self, mod, size, widgets, desc, start, unit, multiplier, **kwargs):
-        super().__init__(size)
+    """
+    Progress meter that shows a Halo spinner.
+
+    Spinners are animated by a shared RenderScheduler (see `get_scheduler`)
+    rather than each starting its own thread. All spinners share one
+    terminal line, so only the most recently started spinner that is still
+    active is drawn; the others are drawn again when it finishes.
+
+    Args:
+        cooperative: If True, the spinner is advanced (at most once per
+            frame interval) by calls to `increment()`, without any thread.
+    """
+    __slots__ = ('spinner', 'cooperative', '_scheduler', '_next_frame')
+
+    def __init__(
+            self, mod, size, widgets, desc, start, unit, multiplier,
+            cooperative=False, **kwargs):
+        super().__init__(size, start, multiplier)
         self.spinner = mod.Halo(text=desc or '')
+        self.cooperative = cooperative
+        self._scheduler = None
+        # Time of the next cooperative frame, or None if frames are not
+        # drawn by increment()
+        self._next_frame = None
 
     def start(self):
         super().start()
-        self.spinner.start()
+        spinner = self.spinner
+        if not all(hasattr(spinner, name) for name in _HALO_INTERNALS):
+            # Not a version of halo whose frames can be drawn externally
+            spinner.start()
+        elif spinner.enabled and spinner._check_stream():
+            spinner._hide_cursor()
+            if self.cooperative:
+                self._advance(self.start_time)
+            else:
+                spinner._render_frame()
+                _ACTIVE.append(self)
+                self._scheduler = get_scheduler(spinner._interval)
+                self._scheduler.add(self)
 
     def finish(self):
-        super().finish()
+        self._check_status(Status.STARTED)
+        if self._scheduler is not None:
+            self._scheduler.remove(self)
+            self._scheduler = None
+            _ACTIVE.remove(self)
+        self._next_frame = None
         self.spinner.succeed()
+        super().finish()
+
+    def reset(self, size=None, desc=None, start=None, multiplier=None):
+        self._reset(size, start, multiplier)
+        self.spinner.text = desc or ''
 
     def increment(self, n=1):
-        pass
+        if self.multiplier:
+            n *= self.multiplier
+        self.count += n
+        if self._next_frame is not None:
+            now = time.monotonic()
+            if now >= self._next_frame:
+                self._advance(now)
+
+    def render(self):
+        """Draws the next frame, if this is the most recently started active
+        spinner. Called by the RenderScheduler.
+        """
+        try:
+            if _ACTIVE[-1] is not self:
+                return
+        except IndexError:
+            return
+        self.spinner._render_frame()
+
+    def _advance(self, now):
+        self._next_frame = now + 0.001 * self.spinner._interval
+        self.spinner._render_frame()
@@ -1,7 +1,13 @@
-from datetime import datetime
+from logging.handlers import QueueListener
+import queue
 import sys
+import threading
+import time
+from typing import Optional
 
-from pokrok.plugins import DefaultProgressMeterFactory, BaseProgressMeter
+from pokrok.plugins import (
+    DefaultProgressMeterFactory, BaseProgressMeter, ProgressMeterError, Status,
+    _next_stride)
 from pokrok.styles import Style, Widget
 
 
@@ -11,9 +17,92 @@ STYLE_SUPERSET = Style(
 )
 
 
+ASYNC_QUEUE_SIZE = 256
+"""Maximum number of progress messages waiting to be written when logging
+asynchronously. Intermediate progress messages are dropped while the queue is
+full; each message supersedes the previous ones, so only the cadence of the
+log is affected."""
+
+
 class LoggingProgressMeterFactory(DefaultProgressMeterFactory):
     def __init__(self):
-        super().__init__("Logging", LoggingProgressMeter, STYLE_SUPERSET)
+        super().__init__(
+            "Logging", LoggingProgressMeter, STYLE_SUPERSET, module_name="logging")
+
+
+class _DrainingQueueListener(QueueListener):
+    """QueueListener that waits for space in the (bounded) queue for the
+    sentinel that stops it, so that stopping it never fails, and only happens
+    after the queued messages have been written.
+    """
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+_LISTENER = None
+_LISTENER_LOCK = threading.Lock()
+
+
+def _get_queue(mod):
+    """Returns the queue of the shared QueueListener thread that writes
+    asynchronous progress messages, starting it if necessary. The thread is
+    stopped (after writing any queued messages) at exit.
+    """
+    global _LISTENER
+    with _LISTENER_LOCK:
+        if _LISTENER is None:
+            import atexit
+            _LISTENER = _DrainingQueueListener(
+                queue.Queue(ASYNC_QUEUE_SIZE), _LoggerDispatcher(mod))
+            _LISTENER.start()
+            atexit.register(_LISTENER.stop)
+        return _LISTENER.queue
+
+
+class _LoggerDispatcher:
+    """Handler for the QueueListener that passes each record to the logger
+    that created it, so the logger's own filters and handlers are used.
+    """
+    def __init__(self, mod):
+        self._mod = mod
+
+    def handle(self, record):
+        self._mod.getLogger(record.name).handle(record)
+
+
+class _Message:
+    """Log message that is formatted when it is written (i.e. by the
+    QueueListener thread) rather than when it is queued.
+    """
+    __slots__ = ('_format', '_values')
+
+    def __init__(self, format, values):
+        self._format = format
+        self._values = values
+
+    def __str__(self):
+        return self._format(*self._values)
+
+
+def _count(meter, now):
+    return meter.count
+
+
+def _scaled_count(meter, now):
+    return meter.count / meter._scale
+
+
+def _elapsed(meter, now):
+    return now - meter.start_time
+
+
+def _bar(meter, now):
+    return meter._bar_fmt.format(
+        meter._bar_char * round((meter.count / meter.size) * meter._bar_size))
+
+
+def _percent(meter, now):
+    return meter.count / meter.size
 
 
 class LoggingProgressMeter(BaseProgressMeter):
@@ -21,9 +110,24 @@ class LoggingProgressMeter(BaseProgressMeter):
     Progress meter that logs messages at a specified interval.
 
     Args:
-        interval: The reporting interval.
-        logger_name:
+        interval: The reporting interval, in number of records.
+        interval_seconds: The reporting interval, in seconds. If specified,
+            this is used instead of `interval`.
+        logger_name: The name of the logger to use.
+        logger_level: The level at which to log messages.
+        asynchronous: Whether to write messages from a background thread, so
+            that a slow log destination never blocks the caller. Messages are
+            passed to the thread through a bounded queue (see
+            `ASYNC_QUEUE_SIZE`).
     """
+    __slots__ = (
+        '_logger', '_level', 'interval', 'interval_seconds', 'message',
+        '_format', '_fields', '_scale', '_widgets', '_unit', '_next_count',
+        '_next_time', '_checked_time', '_checked_count', '_queue')
+
+    _bar_size = 10
+    _bar_char = "*"
+    _bar_fmt = "[{{: <{}}}]".format(_bar_size)
 
     def __init__(
         self,
@@ -35,26 +139,28 @@ class LoggingProgressMeter(BaseProgressMeter):
         unit=None,
         multiplier=None,
         interval: int = 1000,
+        interval_seconds: Optional[float] = None,
         logger_name: str = "progress",
         logger_level: str = "INFO",
+        asynchronous: bool = False,
         **_,
     ):
-        super().__init__(size)
+        super().__init__(size, start, multiplier)
 
         self._logger = mod.getLogger(logger_name)
         self._logger.setLevel(logger_level)
         if not self._logger.hasHandlers():
             self._logger.addHandler(mod.StreamHandler(sys.stderr))
+        if isinstance(logger_level, str):
+            logger_level = mod.getLevelName(logger_level)
         self._level = logger_level
+        self._queue = _get_queue(mod) if asynchronous else None
 
-        self.count = start or 0
-        self.size = size
+        if interval_seconds is not None and interval_seconds <= 0:
+            raise ValueError(
+                "Invalid interval_seconds: {}".format(interval_seconds))
         self.interval = interval
-        self.multiplier = multiplier
-        self.start_time = None
-        self._scale = 1
-        self._bar_size = 10
-        self._bar_char = "*"
+        self.interval_seconds = interval_seconds
 
         default_widgets = STYLE_SUPERSET.get_widgets(size is not None)
 
@@ -62,13 +168,36 @@ class LoggingProgressMeter(BaseProgressMeter):
             widgets = default_widgets
         else:
             allowed = set(default_widgets)
-            widgets = [w for w in widgets if w in allowed]
+            widgets = tuple(w for w in widgets if w in allowed)
+
+        self._widgets = widgets
+        self._unit = unit
+        self._compile(desc)
+        self._schedule(time.monotonic())
+
+    def _compile(self, desc):
+        """Builds the message template, with positional fields, and compiles
+        it into a single formatter that takes the values of `_fields`.
+        """
+        size = self.size
+        widgets = self._widgets
+        unit = self._unit
+        self._scale = 1
 
-        self.key_fns = {}
+        # The functions (of the meter and the current time) that compute the
+        # values to format into the message, in order
+        fields = []
         message = []
 
+        def field(fn, spec=""):
+            fields.append(fn)
+            return "{" + str(len(fields) - 1) + spec + "}"
+
+        def text(value):
+            return str(value).replace("{", "{{").replace("}", "}}")
+
         if desc:
-            message.append(desc)
+            message.append(text(desc))
 
         for w in widgets:
             if w == Widget.COUNTER:
@@ -79,47 +208,107 @@ class LoggingProgressMeter(BaseProgressMeter):
                         size /= 1000
                         self._scale *= 1000
                     if suffix:
-                        message.append("{count:.2f}/" + "{:.2f}".format(size) + suffix)
+                        message.append(
+                            field(_scaled_count, ":.2f") + "/{:.2f}".format(size) + suffix)
                     else:
-                        message.append("{count}/" + str(size))
+                        message.append(field(_count) + "/" + str(size))
                 else:
-                    message.append("{count}")
+                    message.append(field(_count))
                 if unit:
-                    message.append(unit)
-                self.key_fns["count"] = lambda: self.count / self._scale
+                    message.append(text(unit))
             elif w == Widget.ELAPSED:
-                message.append("{elapsed:.1f} seconds")
-                self.key_fns["elapsed"] = (
-                    lambda: datetime.now().timestamp() - self.start_time.timestamp()
-                )
-            elif w == Widget.BAR:
-                message.append("{bar}")
-                bar_fmt = "[{{: <{}}}]".format(self._bar_size)
-                self.key_fns["bar"] = lambda: bar_fmt.format(
-                    self._bar_char * round((self.count / self.size) * self._bar_size)
-                )
+                message.append(field(_elapsed, ":.1f") + " seconds")
+            elif w == Widget.BAR and size is not None:
+                message.append(field(_bar))
             elif w == Widget.PERCENT and size is not None:
                 if Widget.COUNTER in widgets:
-                    message.append("({percent:.0%})")
+                    message.append("(" + field(_percent, ":.0%") + ")")
                 else:
-                    message.append("{percent:.0%}")
-                self.key_fns["percent"] = lambda: self.count / self.size
+                    message.append(field(_percent, ":.0%"))
 
         self.message = " ".join(message)
+        self._format = self.message.format
+        self._fields = tuple(fields)
+
+    def _schedule(self, now):
+        """Sets the count at which `increment` next calls `_report`.
+        """
+        count = self.count
+        if self.interval_seconds is None:
+            # The next multiple of the interval, computed once per message
+            # rather than on every increment
+            self._next_count = (count // self.interval + 1) * self.interval
+        else:
+            self._next_time = now + self.interval_seconds
+            self._checked_time = now
+            self._checked_count = count
+            self._next_count = count + 1
 
     def start(self):
         super().start()
-        self.start_time = datetime.now()
+        self._schedule(self.start_time)
+
+    def reset(self, size=None, desc=None, start=None, multiplier=None):
+        if (size is None) != (self.size is None):
+            raise ProgressMeterError(
+                "Cannot change whether a logging progress meter is sized")
+        self._reset(size, start, multiplier)
+        self._compile(desc)
+        self._schedule(time.monotonic())
 
     def finish(self):
+        self._check_status(Status.STARTED)
+        message = f"Read a total of {self.count} records"
+        if self._queue is None:
+            self._logger.log(self._level, message)
+        else:
+            # The final message is not dropped
+            self._enqueue(message, block=True)
         super().finish()
-        self._logger.log(self._level, f"Read a total of {self.count} records")
 
     def increment(self, n=1):
-        cur_mod = self.count % self.interval
         if self.multiplier:
             n *= self.multiplier
         self.count += n
-        if (self.count % self.interval) <= cur_mod:
-            format_kwargs = dict((key, fn()) for key, fn in self.key_fns.items())
-            self._logger.log(self._level, self.message.format(**format_kwargs))
+        if self.count >= self._next_count:
+            self._report()
+
+    def _report(self):
+        now = time.monotonic()
+        if self.interval_seconds is None:
+            self._log(now)
+            self._schedule(now)
+            return
+
+        count = self.count
+        if now >= self._next_time:
+            self._log(now)
+            self._next_time = now + self.interval_seconds
+        # Only read the clock about 16 times per interval: estimate the rate
+        # from the previous check, and skip the increments expected to take
+        # 1/16 of the interval (growing the stride at most 4-fold per check,
+        # and at most to MAX_STRIDE, so a slowdown is noticed promptly)
+        delta = count - self._checked_count
+        stride = _next_stride(
+            delta, delta, now - self._checked_time, self.interval_seconds / 16)
+        self._checked_time = now
+        self._checked_count = count
+        self._next_count = count + stride
+
+    def _log(self, now):
+        logger = self._logger
+        if logger.isEnabledFor(self._level):
+            values = [fn(self, now) for fn in self._fields]
+            if self._queue is None:
+                logger.log(self._level, self._format(*values))
+            else:
+                self._enqueue(_Message(self._format, values), block=False)
+
+    def _enqueue(self, message, block):
+        logger = self._logger
+        record = logger.makeRecord(
+            logger.name, self._level, "(unknown file)", 0, message, None, None)
+        try:
+            self._queue.put(record, block)
+        except queue.Full:
+            pass
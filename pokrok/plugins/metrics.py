@@ -0,0 +1,332 @@
+"""Plugin that exports the state of progress meters as Prometheus metrics,
+rather than displaying them.
+
+Metrics are written to a node-exporter textfile (which is replaced atomically
+every `interval` seconds), and/or served over HTTP on a local port. Each
+progress meter is its own record: incrementing it only updates its count, and
+the exporter reads the records when it renders the metrics. Progress meters
+are labeled with a slot number, which is reused after the progress meter
+finishes, and a (truncated) description, so the number of series is bounded
+by the number of concurrent progress meters (at most `max_meters`).
+"""
+import heapq
+import math
+import os
+import tempfile
+import threading
+import time
+import warnings
+
+from pokrok.plugins import DefaultProgressMeterFactory, BaseProgressMeter, Status
+
+
+DEFAULT_INTERVAL = 15
+"""Default number of seconds between writes of the textfile."""
+
+DEFAULT_MAX_METERS = 1000
+"""Default maximum number of progress meters that are exported at once."""
+
+MAX_LABEL_LENGTH = 64
+"""Descriptions are truncated to this length when used as label values."""
+
+METRICS = (
+    ('count', 'Number of items processed.'),
+    ('size', 'Total number of items.'),
+    ('elapsed_seconds', 'Seconds since the progress meter started.'),
+    ('rate', 'Average number of items processed per second.'),
+    ('eta_seconds', 'Estimated number of seconds remaining.'),
+    ('finished', 'Whether the progress meter has finished.'),
+)
+"""The metrics exported for each progress meter (prefixed with
+'pokrok_progress_'), with their help text."""
+
+
+class MetricsProgressMeterFactory(DefaultProgressMeterFactory):
+    def __init__(self):
+        super().__init__(
+            'metrics', MetricsProgressMeter, None, module_name='os')
+
+    def provides_mask(self, sized, mask, force=False):
+        # Metrics are not a display, so this plugin is only used if it is
+        # explicitly requested (or no plugin provides a display)
+        return force
+
+
+_EXPORTERS = {}
+_EXPORTERS_LOCK = threading.Lock()
+
+
+def get_exporter(
+        textfile=None, http_port=None, http_host='127.0.0.1',
+        interval=DEFAULT_INTERVAL, max_meters=DEFAULT_MAX_METERS):
+    """Returns the MetricsExporter for the given arguments, creating it if
+    necessary.
+    """
+    key = (textfile and os.path.abspath(os.path.expanduser(textfile)),
+           http_port, http_host, interval, max_meters)
+    with _EXPORTERS_LOCK:
+        exporter = _EXPORTERS.get(key)
+        if exporter is None:
+            exporter = _EXPORTERS[key] = MetricsExporter(*key)
+        return exporter
+
+
+class MetricsExporter:
+    """
+    Keeps track of active progress meters and renders them in the Prometheus
+    text exposition format.
+
+    Args:
+        textfile: Path of the textfile to write, or None.
+        http_port: Local port on which to serve the metrics, or None.
+        http_host: Address on which to serve the metrics.
+        interval: Number of seconds between writes of the textfile.
+        max_meters: Maximum number of progress meters to export at once.
+            Additional progress meters are counted in the
+            pokrok_progress_dropped_meters metric.
+    """
+
+    def __init__(
+            self, textfile=None, http_port=None, http_host='127.0.0.1',
+            interval=DEFAULT_INTERVAL, max_meters=DEFAULT_MAX_METERS):
+        self.textfile = textfile
+        self.interval = interval
+        self.max_meters = max_meters
+        self._lock = threading.Lock()
+        self._meters = {}
+        self._final = {}
+        self._free = []
+        self._next_slot = 0
+        self._dropped = 0
+        self._writer = None
+        self._write_failed = False
+        self._server = None
+        if http_port is not None:
+            self._serve(http_host, http_port)
+
+    def add(self, meter):
+        """Starts exporting a progress meter.
+
+        Returns:
+            The slot assigned to the progress meter, or None if `max_meters`
+            progress meters are already being exported.
+        """
+        with self._lock:
+            if self._free:
+                slot = heapq.heappop(self._free)
+                del self._final[slot]
+            elif self._next_slot < self.max_meters:
+                slot = self._next_slot
+                self._next_slot += 1
+            else:
+                self._dropped += 1
+                return None
+            self._meters[slot] = meter
+            if self.textfile and self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_periodically, name='pokrok-metrics',
+                    daemon=True)
+                self._writer.start()
+        return slot
+
+    def remove(self, slot):
+        """Stops exporting a progress meter. Its final values continue to be
+        exported until its slot is reused.
+        """
+        now = time.monotonic()
+        with self._lock:
+            meter = self._meters.pop(slot)
+            self._final[slot] = (meter.desc, _sample(meter, now, True))
+            heapq.heappush(self._free, slot)
+
+    def render(self):
+        """Renders the metrics of all active progress meters, and the final
+        values of finished progress meters whose slots have not been reused.
+        """
+        now = time.monotonic()
+        with self._lock:
+            active = list(self._meters.items())
+            final = dict(self._final)
+            dropped = self._dropped
+        for slot, meter in active:
+            final[slot] = (meter.desc, _sample(meter, now))
+        samples = sorted(final.items())
+
+        lines = []
+        for i, (name, help_text) in enumerate(METRICS):
+            metric = 'pokrok_progress_' + name
+            lines.append('# HELP {} {}'.format(metric, help_text))
+            lines.append('# TYPE {} gauge'.format(metric))
+            for slot, (desc, values) in samples:
+                if values[i] is not None:
+                    lines.append('{}{{slot="{}",desc="{}"}} {}'.format(
+                        metric, slot, desc, _format_value(values[i])))
+        lines.append(
+            '# HELP pokrok_progress_dropped_meters Number of progress meters '
+            'that were not exported because max_meters was reached.')
+        lines.append('# TYPE pokrok_progress_dropped_meters counter')
+        lines.append('pokrok_progress_dropped_meters {}'.format(dropped))
+        return '\n'.join(lines) + '\n'
+
+    def write(self):
+        """Writes the metrics to the textfile, replacing it atomically.
+        """
+        text = self.render()
+        # A unique temporary file, so that concurrent writers of the same
+        # textfile don't replace each other's partially written files. Its
+        # name doesn't end with .prom, so node-exporter ignores it
+        directory, name = os.path.split(self.textfile)
+        fd, tmp = tempfile.mkstemp(
+            prefix='.' + name + '.', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+            # mkstemp creates the file readable only by its owner
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, self.textfile)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _write_periodically(self):
+        try:
+            while True:
+                time.sleep(self.interval)
+                with self._lock:
+                    done = not self._meters
+                    if done:
+                        self._writer = None
+                # Always write once more after the last progress meter
+                # finishes
+                try:
+                    self.write()
+                    self._write_failed = False
+                except OSError as err:
+                    # Keep trying (e.g. the directory may be created later),
+                    # but only warn once per run of failures
+                    if not self._write_failed:
+                        self._write_failed = True
+                        warnings.warn(
+                            "Could not write metrics to {}: {}".format(
+                                self.textfile, err), RuntimeWarning)
+                if done:
+                    return
+        finally:
+            with self._lock:
+                if self._writer is threading.current_thread():
+                    # Stopped by an unexpected error; let the next progress
+                    # meter start a new writer
+                    self._writer = None
+
+    def _serve(self, host, port):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = exporter.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header(
+                    'Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Don't write to the terminal
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name='pokrok-metrics-http',
+            daemon=True).start()
+
+
+def _sample(meter, now, finished=False):
+    """Returns the values of METRICS for a progress meter (None for values
+    that are not defined).
+    """
+    count = meter.count
+    size = meter.size
+    start_time = meter.start_time
+    elapsed = (now - start_time) if start_time is not None else 0.0
+    rate = count / elapsed if elapsed > 0 else None
+    if size is None or finished:
+        eta = 0.0 if finished and size is not None else None
+    else:
+        eta = max(size - count, 0) / rate if rate else None
+    return (count, size, elapsed, rate, eta, int(finished))
+
+
+def _format_value(value):
+    if isinstance(value, float) and not math.isfinite(value):
+        return 'NaN' if math.isnan(value) else '+Inf' if value > 0 else '-Inf'
+    return repr(value)
+
+
+def _label_value(text):
+    text = (text or '')[:MAX_LABEL_LENGTH]
+    return text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsProgressMeter(BaseProgressMeter):
+    """
+    Progress meter that is exported as Prometheus metrics.
+
+    Args:
+        textfile: Path of a node-exporter textfile (e.g. ending in '.prom')
+            to write the metrics to.
+        http_port: Local port on which to serve the metrics.
+        http_host: Address on which to serve the metrics (default: localhost).
+        interval: Number of seconds between writes of the textfile.
+        max_meters: Maximum number of progress meters to export at once.
+    """
+    __slots__ = ('desc', 'slot', '_exporter')
+
+    def __init__(
+        self,
+        mod,
+        size,
+        widgets,
+        desc=None,
+        start=None,
+        unit=None,
+        multiplier=None,
+        textfile=None,
+        http_port=None,
+        http_host='127.0.0.1',
+        interval=DEFAULT_INTERVAL,
+        max_meters=DEFAULT_MAX_METERS,
+        **_
+    ):
+        super().__init__(size, start, multiplier)
+        self.desc = _label_value(desc)
+        self.slot = None
+        self._exporter = get_exporter(
+            textfile, http_port, http_host, interval, max_meters)
+
+    def start(self):
+        super().start()
+        self.slot = self._exporter.add(self)
+
+    def finish(self):
+        self._check_status(Status.STARTED)
+        if self.slot is not None:
+            self._exporter.remove(self.slot)
+            self.slot = None
+        super().finish()
+
+    def reset(self, size=None, desc=None, start=None, multiplier=None):
+        self._reset(size, start, multiplier)
+        self.desc = _label_value(desc)
+
+    def increment(self, n=1):
+        if self._status is not Status.STARTED:
+            self._check_status(Status.STARTED)
+        if self.multiplier:
+            n *= self.multiplier
+        self.count += n
@@ -0,0 +1,83 @@
+"""Plugin that shows no progress at all.
+
+Selecting this plugin first (e.g. `set_plugins(['null'])`), or setting the
+`POKROK_DISABLE` environment variable, disables progress meters entirely: the
+pokrok API functions then return the original iterables, and the shared
+`NULL_PROGRESS_METER`, without loading any other plugins.
+"""
+from pokrok.plugins import ProgressMeter, ProgressMeterFactory, Status
+
+
+class NullProgressMeterFactory(ProgressMeterFactory):
+    name = 'null'
+    installed = True
+
+    def provides(self, sized, widgets=None, force=False):
+        # Never chosen over a plugin that actually provides the requested
+        # style, but may be requested explicitly
+        return force
+
+    def create(
+        self,
+        size=None,
+        widgets=None,
+        desc=None,
+        start=None,
+        unit=None,
+        multiplier=None,
+        **kwargs
+    ):
+        return NULL_PROGRESS_METER
+
+    def iterate(
+        self,
+        iterable,
+        size=None,
+        widgets=None,
+        desc=None,
+        start=None,
+        unit=None,
+        multiplier=None,
+        **kwargs
+    ):
+        return iterable
+
+
+class NullProgressMeter(ProgressMeter):
+    """
+    Progress meter that does nothing. It has no state, so a single instance
+    (`NULL_PROGRESS_METER`) is shared, and always reports that it has
+    started.
+    """
+    __slots__ = ()
+
+    is_sized = False
+    status = Status.STARTED
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def start(self):
+        pass
+
+    def finish(self):
+        pass
+
+    def increment(self, n=1):
+        pass
+
+    def reset(self, size=None, desc=None, start=None, multiplier=None):
+        pass
+
+
+NULL_PROGRESS_METER = NullProgressMeter()
+"""The shared NullProgressMeter instance."""
@@ -1,4 +1,5 @@
-from pokrok.plugins import DefaultProgressMeterFactory, BaseProgressMeter, Status
+from pokrok.plugins import (
+    DefaultProgressMeterFactory, BaseProgressMeter, ProgressMeterError, Status)
 from pokrok.styles import Style, Widget
 
 
@@ -12,42 +13,70 @@ class Progressbar2ProgressMeterFactory(DefaultProgressMeterFactory):
 
     def iterate(
             self, iterable, size=None, widgets=None, desc=None, start=None, unit=None,
-            multiplier=None, **kwargs):
+            multiplier=None, mininterval=None, miniters=None, **kwargs):
         if multiplier is None and self._load_module():
+            # progressbar2 throttles redraws itself; it has no equivalent of
+            # miniters
+            throttle = {}
+            if mininterval is not None:
+                throttle['min_poll_interval'] = mininterval
             pb = self._module.ProgressBar(
-                widgets=create_widgets(self._module, widgets, desc, unit),
+                widgets=create_widgets(
+                    self._module, widgets or DEFAULT_STYLE.get_widgets(size is not None),
+                    desc, unit),
                 initial_value=start or 0,
-                max_value=size or self._module.UnknownLength
+                max_value=size or self._module.UnknownLength,
+                **throttle
             )
             return pb(iterable)
         else:
             return super().iterate(
-                iterable, size, widgets, desc, start, unit, multiplier, **kwargs)
+                iterable, size, widgets, desc, start, unit, multiplier,
+                mininterval, miniters, **kwargs)
 
 
 class Progressbar2ProgressMeter(BaseProgressMeter):
+    __slots__ = ('pb', '_mod', '_desc')
+
     def __init__(self, mod, size, widgets, desc, start, unit, multiplier, **kwargs):
-        super().__init__(size)
+        super().__init__(size, start, multiplier)
         self.pb = mod.ProgressBar(
-            widgets=create_widgets(mod, widgets, desc, unit),
+            widgets=create_widgets(
+                mod, widgets or DEFAULT_STYLE.get_widgets(size is not None), desc, unit),
             initial_value=start or 0,
             max_value=size or mod.UnknownLength
         )
-        self.multiplier = multiplier
+        self._mod = mod
+        self._desc = desc
 
     def start(self):
         super().start()
         self.pb.start()
 
     def finish(self):
-        super().finish()
+        self._check_status(Status.STARTED)
         self.pb.finish()
+        super().finish()
+
+    def reset(self, size=None, desc=None, start=None, multiplier=None):
+        if bool(desc) != bool(self._desc):
+            raise ProgressMeterError(
+                "Cannot add or remove the description of a progress bar")
+        self._reset(size, start, multiplier)
+        if desc:
+            # The description is always the first widget
+            self.pb.widgets[0] = desc
+            self._desc = desc
+        self.pb.initial_value = start or 0
+        self.pb.max_value = size or self._mod.UnknownLength
 
     def increment(self, n=1):
-        self._check_status(Status.STARTED)
+        if self._status is not Status.STARTED:
+            self._check_status(Status.STARTED)
         if self.multiplier:
             n *= self.multiplier
-        self.pb.update(self.pb.value + n)
+        self.count += n
+        self.pb.update(self.count)
 
 
 PB_WIDGETS = {
@@ -60,6 +89,13 @@ PB_WIDGETS = {
 }
 """Mapping of pokrok widget types onto progressbar2 widget classes."""
 
+DEFAULT_STYLE = Style(
+    sized=[Widget.PERCENT, Widget.COUNTER, Widget.BAR, Widget.ELAPSED, Widget.ETA],
+    unsized=[Widget.SPINNER, Widget.COUNTER, Widget.ELAPSED]
+)
+"""Widgets to use when no style is requested, similar to progressbar2's own
+defaults."""
+
 
 def create_widgets(mod, widgets, desc=None, unit=None):
     pb_widgets = []
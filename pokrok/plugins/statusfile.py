@@ -0,0 +1,194 @@
+"""Plugin that writes the state of a progress meter to a small status file,
+rather than displaying it, so that batch schedulers and dashboards can poll
+the progress of a job.
+
+The file is rewritten atomically (a temporary file is written, and then
+renamed over the status file), at most once every `interval` seconds, plus
+once when the progress meter starts and once when it finishes. A failed
+write is reported with a RuntimeWarning rather than raised, so it never
+interrupts the task whose progress is being reported.
+"""
+from itertools import count
+import os
+import tempfile
+import time
+import warnings
+
+from pokrok.plugins import DefaultProgressMeterFactory, BaseProgressMeter, Status
+
+
+DEFAULT_PATH = 'pokrok-status-{pid}-{index}.json'
+"""Default status file path. Each progress meter in a process has a
+different index, so concurrent progress meters do not share a file."""
+
+DEFAULT_INTERVAL = 5
+"""Default minimum number of seconds between writes."""
+
+FORMATS = ('json', 'kv')
+"""Supported status file formats: a JSON object, or key=value lines."""
+
+
+_INDEX = count()
+
+
+class StatusFileProgressMeterFactory(DefaultProgressMeterFactory):
+    def __init__(self):
+        super().__init__(
+            'statusfile', StatusFileProgressMeter, None, module_name='json')
+
+    def provides_mask(self, sized, mask, force=False):
+        # A status file is not a display, so this plugin is only used if it
+        # is explicitly requested (or no plugin provides a display)
+        return force
+
+
+class StatusFileProgressMeter(BaseProgressMeter):
+    """
+    Progress meter that writes its state to a file: the description, count,
+    size, elapsed time, rate (items per second), ETA (seconds), status (the
+    name of a `Status`), and the time of the update (seconds since the
+    epoch).
+
+    Args:
+        path: Path of the status file. May contain the fields {pid}, {desc}
+            and {index} (a sequence number of the progress meter within
+            the process). Progress meters that are active at the same time
+            should not use the same path.
+        format: 'json' or 'kv'.
+        interval: Minimum number of seconds between writes.
+        fsync: Whether to sync each write to disk before renaming it.
+    """
+    __slots__ = (
+        'path', 'interval', 'desc', '_mod', '_format', '_fsync',
+        '_next_write', '_write_failed')
+
+    def __init__(
+        self,
+        mod,
+        size,
+        widgets,
+        desc=None,
+        start=None,
+        unit=None,
+        multiplier=None,
+        path=DEFAULT_PATH,
+        format='json',
+        interval=DEFAULT_INTERVAL,
+        fsync=True,
+        **_
+    ):
+        super().__init__(size, start, multiplier)
+        if format not in FORMATS:
+            raise ValueError("Invalid status file format: {}".format(format))
+        self._mod = mod
+        self._format = format
+        self._fsync = fsync
+        self.interval = interval
+        self.desc = desc
+        self.path = os.path.abspath(os.path.expanduser(path.format(
+            pid=os.getpid(), desc=desc or '', index=next(_INDEX))))
+        self._next_write = 0
+        self._write_failed = False
+
+    def start(self):
+        super().start()
+        self.write()
+
+    def finish(self):
+        self._check_status(Status.STARTED)
+        self.write(status=Status.FINISHED)
+        super().finish()
+
+    def reset(self, size=None, desc=None, start=None, multiplier=None):
+        self._reset(size, start, multiplier)
+        self.desc = desc
+        self._next_write = 0
+
+    def increment(self, n=1):
+        if self._status is not Status.STARTED:
+            self._check_status(Status.STARTED)
+        if self.multiplier:
+            n *= self.multiplier
+        self.count += n
+        now = time.monotonic()
+        if now >= self._next_write:
+            self.write(now)
+
+    def record(self, now=None, status=None):
+        """Returns the current state as a dict.
+
+        Args:
+            now: The current value of `time.monotonic()`.
+            status: The status to report, if not the current status.
+        """
+        if now is None:
+            now = time.monotonic()
+        if status is None:
+            status = self._status
+        count = self.count
+        size = self.size
+        elapsed = now - self.start_time if self.start_time is not None else 0.0
+        rate = count / elapsed if elapsed > 0 else None
+        if status is Status.FINISHED:
+            eta = 0.0
+        elif size is not None and rate:
+            eta = max(size - count, 0) / rate
+        else:
+            eta = None
+        return {
+            'desc': self.desc,
+            'count': count,
+            'size': size,
+            'elapsed': elapsed,
+            'rate': rate,
+            'eta': eta,
+            'status': status.name,
+            'updated': time.time(),
+        }
+
+    def write(self, now=None, status=None):
+        """Writes the current state to the status file, replacing it
+        atomically. If the file cannot be written, a RuntimeWarning is issued
+        (once, until a write succeeds). See `record` for the arguments.
+        """
+        if now is None:
+            now = time.monotonic()
+        self._next_write = now + self.interval
+        record = self.record(now, status)
+        if self._format == 'json':
+            text = self._mod.dumps(record) + '\n'
+        else:
+            text = ''.join(
+                '{}={}\n'.format(
+                    key, '' if value is None else str(value).replace('\n', ' '))
+                for key, value in record.items())
+        try:
+            self._replace(text)
+        except OSError as err:
+            if not self._write_failed:
+                self._write_failed = True
+                warnings.warn(
+                    "Could not write status file {}: {}".format(self.path, err),
+                    RuntimeWarning)
+        else:
+            self._write_failed = False
+
+    def _replace(self, text):
+        directory, name = os.path.split(self.path)
+        fd, tmp = tempfile.mkstemp(
+            prefix='.' + name + '.', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+                if self._fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            # mkstemp creates the file readable only by its owner
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
@@ -4,6 +4,8 @@ from pokrok.styles import Style, Widget
 
 
 class TqdmProgressMeterFactory(DefaultProgressMeterFactory):
+    positionable = True
+
     def __init__(self):
         style_superset = Style([
             Widget.BAR, Widget.ETA, Widget.ELAPSED, Widget.SPINNER
@@ -12,34 +14,57 @@ class TqdmProgressMeterFactory(DefaultProgressMeterFactory):
 
     def iterate(
             self, iterable, size=None, widgets=None, desc=None, start=None, unit=None,
-            multiplier=None, **kwargs
+            multiplier=None, mininterval=None, miniters=None, **kwargs
     ):
         if multiplier is None and self._load_module():
+            # tqdm implements its own (adaptive) update throttling
+            throttle = {}
+            if mininterval is not None:
+                throttle['mininterval'] = mininterval
+            if miniters is not None:
+                throttle['miniters'] = miniters
             return self._module.tqdm(
                 iterable, total=size, desc=desc, initial=start or 0, unit_scale=True,
-                unit=unit or 'it')
+                unit=unit or 'it', **throttle)
         else:
             return super().iterate(
-                iterable, size, widgets, desc, start, unit, multiplier)
+                iterable, size, widgets, desc, start, unit, multiplier,
+                mininterval, miniters)
 
 
 class TqdmProgressMeter(BaseProgressMeter):
+    # A closed tqdm bar cannot be reopened through tqdm's public API, so
+    # these progress meters do not implement reset() and are not pooled
+    __slots__ = ('tqdm', '_display')
+
     def __init__(
             self, mod, size, widgets, desc, start, unit, multiplier,
-            unit_scale=True, **kwargs
+            unit_scale=True, mininterval=None, miniters=None, position=None,
+            leave=True, display=None, **kwargs
     ):
-        super().__init__(size)
+        super().__init__(size, start, multiplier)
+        throttle = {}
+        if mininterval is not None:
+            throttle['mininterval'] = mininterval
+        if miniters is not None:
+            throttle['miniters'] = miniters
+        # tqdm draws the bar on its row itself
+        self._display = display
         self.tqdm = mod.tqdm(
             total=size, desc=desc, initial=start or 0, unit_scale=unit_scale,
-            unit=unit or 'it')
-        self.multiplier = multiplier
+            unit=unit or 'it', position=position, leave=leave, **throttle)
 
     def finish(self):
-        super().finish()
+        self._check_status(Status.STARTED)
         self.tqdm.close()
+        if self._display is not None:
+            self._display(None, True)
+        super().finish()
 
     def increment(self, n=1):
-        self._check_status(Status.STARTED)
+        if self._status is not Status.STARTED:
+            self._check_status(Status.STARTED)
         if self.multiplier:
             n *= self.multiplier
+        self.count += n
         self.tqdm.update(n)
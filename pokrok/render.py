@@ -0,0 +1,220 @@
+"""Background rendering of progress meters.
+
+When background rendering is enabled (see `ProgressFactory.set_frame_rate`),
+each progress meter is wrapped in a `DeferredProgressMeter`, whose
+`increment()` only adds to a counter. A single `RenderScheduler` thread
+forwards the accumulated counts to the wrapped progress meters (and thus to
+their backends) at a fixed frame rate, which takes terminal I/O and
+formatting off the caller's thread and caps the total number of redraws per
+second regardless of how many progress meters are active.
+"""
+import threading
+import time
+
+from pokrok.plugins import ProgressMeter
+
+
+DEFAULT_FRAME_RATE = 10
+"""Default number of frames per second drawn by the render thread."""
+
+_SCHEDULER = None
+_SCHEDULER_LOCK = threading.Lock()
+
+
+def get_scheduler():
+    """Returns a shared RenderScheduler with the default frame rate, for
+    progress meters that need to be rendered in the background even if
+    background rendering is not enabled.
+    """
+    global _SCHEDULER
+    if _SCHEDULER is None:
+        with _SCHEDULER_LOCK:
+            if _SCHEDULER is None:
+                _SCHEDULER = RenderScheduler(DEFAULT_FRAME_RATE)
+    return _SCHEDULER
+
+
+class RenderScheduler:
+    """
+    Periodically renders all active DeferredProgressMeters from a single
+    daemon thread. The thread is started when the first progress meter is
+    added, and exits when there are no active progress meters.
+
+    Args:
+        frame_rate: Number of frames per second.
+    """
+
+    def __init__(self, frame_rate=DEFAULT_FRAME_RATE):
+        if frame_rate <= 0:
+            raise ValueError("Invalid frame rate: {}".format(frame_rate))
+        self.interval = 1 / frame_rate
+        self._meters = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def add(self, meter):
+        """Starts rendering a DeferredProgressMeter.
+        """
+        with self._lock:
+            self._meters.append(meter)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='pokrok-render', daemon=True)
+                self._thread.start()
+
+    def remove(self, meter):
+        """Stops rendering a DeferredProgressMeter. If a frame is being
+        rendered, this waits for it to complete.
+        """
+        with self._lock:
+            try:
+                self._meters.remove(meter)
+            except ValueError:
+                pass
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._meters:
+                    self._thread = None
+                    return
+                failed = []
+                for meter in self._meters:
+                    try:
+                        meter.render()
+                    except Exception:
+                        # Don't let one broken progress meter stop the others
+                        failed.append(meter)
+                for meter in failed:
+                    self._meters.remove(meter)
+
+
+class DeferredProgressMeter(ProgressMeter):
+    """
+    Wraps a progress meter so that `increment()` only updates a counter. The
+    wrapped progress meter is updated by a RenderScheduler, and when the
+    progress meter finishes.
+
+    Args:
+        meter: The ProgressMeter to wrap.
+        scheduler: The RenderScheduler.
+    """
+    __slots__ = ('meter', 'count', '_rendered', '_scheduler')
+
+    def __init__(self, meter, scheduler):
+        self.meter = meter
+        self.count = 0
+        self._rendered = 0
+        self._scheduler = scheduler
+
+    @property
+    def is_sized(self):
+        return self.meter.is_sized
+
+    @property
+    def status(self):
+        return self.meter.status
+
+    def start(self):
+        self.meter.start()
+        self._scheduler.add(self)
+
+    def finish(self):
+        self._scheduler.remove(self)
+        self.render()
+        self.meter.finish()
+
+    def increment(self, n=1):
+        self.count += n
+
+    def reset(self, size=None, desc=None, start=None, multiplier=None):
+        self.meter.reset(size, desc, start, multiplier)
+        self.count = self._rendered = 0
+
+    def render(self):
+        """Forwards the count accumulated since the last frame to the wrapped
+        progress meter. Only the scheduler thread (or the thread finishing the
+        progress meter) calls this method, and `increment()` only ever adds to
+        `count`, so no increments are lost.
+        """
+        count = self.count
+        delta = count - self._rendered
+        if delta:
+            self._rendered = count
+            self.meter.increment(delta)
+
+
+class ThreadSafeProgressMeter(ProgressMeter):
+    """
+    Wraps a progress meter so that it can be incremented by multiple threads
+    concurrently. Each thread adds to its own counter (a "cell"), so
+    increments never contend with each other, and the wrapped progress meter
+    (which need not be thread-safe) is only ever updated by one thread at a
+    time: the RenderScheduler, which periodically forwards the sum of the
+    cells, or the thread that finishes the progress meter. Cells of threads
+    that have exited are kept, so their counts are not lost.
+
+    Args:
+        meter: The ProgressMeter to wrap.
+        scheduler: The RenderScheduler.
+    """
+    __slots__ = ('meter', '_local', '_cells', '_lock', '_rendered', '_scheduler')
+
+    def __init__(self, meter, scheduler):
+        self.meter = meter
+        self._scheduler = scheduler
+        self._lock = threading.Lock()
+        self._clear()
+
+    @property
+    def is_sized(self):
+        return self.meter.is_sized
+
+    @property
+    def status(self):
+        return self.meter.status
+
+    @property
+    def count(self):
+        """The sum of the counts of all threads.
+        """
+        return sum(cell[0] for cell in self._cells)
+
+    def start(self):
+        self.meter.start()
+        self._scheduler.add(self)
+
+    def finish(self):
+        self._scheduler.remove(self)
+        self.render()
+        self.meter.finish()
+
+    def increment(self, n=1):
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._local.cell = [0]
+            with self._lock:
+                # Copy, so the list is never modified while it is summed
+                self._cells = self._cells + [cell]
+        cell[0] += n
+
+    def reset(self, size=None, desc=None, start=None, multiplier=None):
+        self.meter.reset(size, desc, start, multiplier)
+        self._clear()
+
+    def render(self):
+        """Forwards the count accumulated by all threads since the last
+        frame to the wrapped progress meter.
+        """
+        count = self.count
+        delta = count - self._rendered
+        if delta:
+            self._rendered = count
+            self.meter.increment(delta)
+
+    def _clear(self):
+        self._local = threading.local()
+        self._cells = []
+        self._rendered = 0
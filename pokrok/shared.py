@@ -0,0 +1,232 @@
+"""Progress meters that are incremented by multiple processes.
+
+A `SharedProgress` allocates an array of 64-bit counters in shared memory,
+and hands out picklable `SharedCounter` handles. Each process that increments
+a handle claims one counter (slot) the first time it does so, and afterwards
+only writes to its slot; there are no locks, proxies or messages per
+increment. The parent periodically sums the slots and forwards the total to an
+ordinary progress meter created by any plugin. Since each slot is only written
+by one process, and holds that process's total count, the count remains
+correct if a worker dies (the items it processed before dying are counted).
+"""
+import multiprocessing
+import os
+import weakref
+from multiprocessing import shared_memory
+from multiprocessing.context import assert_spawning
+
+from pokrok.plugins import ProgressMeter, ProgressMeterError
+from pokrok.render import RenderScheduler
+
+
+DEFAULT_SLOTS = 64
+"""Default number of processes that can increment the handles of a
+SharedProgress."""
+
+# Layout of the shared memory block: the number of claimed slots, the counter
+# of the creating process, then one counter per slot
+_CLAIMED = 0
+_OWN = 1
+_FIRST_SLOT = 2
+
+
+class SharedProgress(ProgressMeter):
+    """
+    Progress meter whose count is the sum of counters in shared memory.
+    Increments of the SharedProgress itself go to a counter reserved for the
+    creating process.
+
+    Args:
+        slots: The number of processes that can increment handles.
+        interval: Number of seconds between updates of the progress meter.
+        mp_context: The multiprocessing context used to start the worker
+            processes, if not the default context.
+        kwargs: Arguments used to create the progress meter that is
+            displayed - see `pokrok.progress_meter`.
+
+    Examples:
+        def init_worker(handle):
+            global counter
+            counter = handle
+
+        with SharedProgress(size=len(items)) as progress:
+            with multiprocessing.Pool(
+                    4, initializer=init_worker, initargs=(progress.handle(),)
+            ) as pool:
+                pool.map(work, chunks)  # work() calls counter.increment()
+
+    Attributes:
+        meter: The progress meter that displays the total count.
+    """
+    __slots__ = (
+        'meter', 'slots', '_shm', '_counts', '_totals', '_lock', '_rendered',
+        '_scheduler')
+
+    def __init__(
+            self, slots=DEFAULT_SLOTS, interval=0.1, mp_context=None, **kwargs):
+        from pokrok import progress_meter
+        self.meter = progress_meter(**kwargs)
+        self.slots = slots
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=8 * (_FIRST_SLOT + slots))
+        self._counts = self._shm.buf.cast('q')
+        self._totals = self._counts[_OWN:]
+        self._lock = (mp_context or multiprocessing).Lock()
+        self._rendered = 0
+        self._scheduler = RenderScheduler(1 / interval)
+
+    @property
+    def is_sized(self):
+        return self.meter.is_sized
+
+    @property
+    def status(self):
+        return self.meter.status
+
+    @property
+    def count(self):
+        """The sum of all counters.
+        """
+        return sum(self._totals)
+
+    def handle(self):
+        """Creates a handle for worker processes to increment. A handle can
+        only be passed to a process when the process is started, e.g. as an
+        argument of `multiprocessing.Process`, or in the `initargs` of a
+        `multiprocessing.Pool`; it can be shared by any number of processes
+        (up to `slots`), and each process may use it from only one thread.
+
+        Returns:
+            A SharedCounter.
+        """
+        return SharedCounter(self._shm.name, self._lock, self.slots)
+
+    def start(self):
+        self.meter.start()
+        self._scheduler.add(self)
+
+    def finish(self):
+        self._scheduler.remove(self)
+        try:
+            self.render()
+            self.meter.finish()
+        finally:
+            self._totals.release()
+            self._counts.release()
+            self._shm.close()
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def increment(self, n=1):
+        self._counts[_OWN] += n
+
+    def render(self):
+        """Forwards the increase in the total count since the last call to
+        the progress meter. Called by the render thread, and when the
+        progress meter finishes.
+        """
+        count = sum(self._totals)
+        delta = count - self._rendered
+        if delta:
+            self._rendered = count
+            self.meter.increment(delta)
+
+
+_ATTACHED = weakref.WeakSet()
+"""SharedCounters that are attached to their shared memory block, which are
+detached in the child after a fork so that the child claims its own slot."""
+
+
+class SharedCounter:
+    """
+    Handle to the counters of a SharedProgress. The shared memory block is
+    attached, by name, and a slot is claimed, the first time the handle is
+    incremented in a process. The block is detached by `close()`, or when the
+    handle is garbage collected or the process exits.
+
+    Args:
+        name: Name of the shared memory block.
+        lock: Lock that serializes claiming slots.
+        slots: The number of slots.
+    """
+    __slots__ = (
+        'name', 'slot', 'slots', '_lock', '_counts', '_finalizer',
+        '__weakref__')
+
+    def __init__(self, name, lock, slots):
+        self.name = name
+        self.slots = slots
+        self.slot = None
+        self._lock = lock
+        self._counts = None
+        self._finalizer = None
+
+    def __getstate__(self):
+        assert_spawning(self)
+        return self.name, self._lock, self.slots
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def increment(self, n=1):
+        """Adds `n` to this process's counter.
+        """
+        counts = self._counts
+        if counts is None:
+            counts = self._attach()
+        counts[self.slot] += n
+
+    def close(self):
+        """Detaches the shared memory block. The handle can still be
+        incremented afterwards, which attaches the block again.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+            self._counts = None
+            _ATTACHED.discard(self)
+
+    def _attach(self):
+        try:
+            # Python 3.13+: don't register the block with the resource
+            # tracker; only the creating process unlinks it
+            shm = shared_memory.SharedMemory(self.name, track=False)
+        except TypeError:
+            # Processes started by multiprocessing share the creating
+            # process's resource tracker, for which registering the block
+            # again is a no-op
+            shm = shared_memory.SharedMemory(self.name)
+        counts = shm.buf.cast('q')
+        if self.slot is None:
+            with self._lock:
+                claimed = counts[_CLAIMED]
+                if claimed < self.slots:
+                    counts[_CLAIMED] = claimed + 1
+            if claimed >= self.slots:
+                _detach(shm, counts)
+                raise ProgressMeterError(
+                    "All {} slots of the SharedProgress are in use".format(
+                        self.slots))
+            self.slot = _FIRST_SLOT + claimed
+        self._counts = counts
+        self._finalizer = weakref.finalize(self, _detach, shm, counts)
+        _ATTACHED.add(self)
+        return counts
+
+
+def _detach(shm, counts):
+    # The view must be released before the block can be closed
+    counts.release()
+    shm.close()
+
+
+def _forget_attached():
+    for counter in list(_ATTACHED):
+        counter.close()
+        counter.slot = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_attached)
@@ -12,6 +12,26 @@ class Widget(enum.Enum):
     COUNTER = 'COUNTER'
     PERCENT = 'PERCENT'
 
+    @property
+    def bit(self):
+        """The flag bit that represents this widget in a widget mask.
+        """
+        return _WIDGET_BITS[self]
+
+
+_WIDGET_BITS = dict((widget, 1 << i) for i, widget in enumerate(Widget))
+
+
+def widgets_mask(widgets):
+    """Returns the bit mask for a collection of widgets, in which the bit of
+    each widget (`Widget.bit`) is set.
+    """
+    mask = 0
+    if widgets:
+        for widget in widgets:
+            mask |= _WIDGET_BITS[widget]
+    return mask
+
 
 class StyleManager(dict):
     def __init__(self, default_style=None):
@@ -31,28 +51,63 @@ class StyleManager(dict):
 
 class Style:
     """
+    An immutable, hashable set of widgets for sized and unsized progress
+    meters. The bit mask of each widget tuple is precomputed, so that plugins
+    can check whether they support a style using integer operations.
+
     Args:
         widgets: Widgets to use for `sized` and `unsized` unless they are not
             None.
         sized: Widgets for sized progress meters.
-        unsized: Widgets specifically for unsized progress meters.s
+        unsized: Widgets specifically for unsized progress meters.
     """
+    __slots__ = ('sized', 'unsized', 'sized_mask', 'unsized_mask', '_hash')
+
     def __init__(self, widgets=None, sized=None, unsized=None):
         if widgets:
-            self.sized = _resolve_widgets(sized or widgets)
-            self.unsized = _resolve_widgets(unsized or widgets)
+            sized = _resolve_widgets(sized or widgets)
+            unsized = _resolve_widgets(unsized or widgets)
         else:
-            self.sized = _resolve_widgets(sized)
-            self.unsized = _resolve_widgets(unsized)
+            sized = _resolve_widgets(sized)
+            unsized = _resolve_widgets(unsized)
+        init = object.__setattr__
+        init(self, 'sized', sized)
+        init(self, 'unsized', unsized)
+        init(self, 'sized_mask', widgets_mask(sized))
+        init(self, 'unsized_mask', widgets_mask(unsized))
+        init(self, '_hash', hash((sized, unsized)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Style objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Style objects are immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, Style):
+            return NotImplemented
+        return self.sized == other.sized and self.unsized == other.unsized
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return Style, (None, self.sized, self.unsized)
+
+    def __repr__(self):
+        return "Style(sized={!r}, unsized={!r})".format(self.sized, self.unsized)
 
     def get_widgets(self, sized):
         return self.sized if sized else self.unsized
 
+    def get_mask(self, sized):
+        return self.sized_mask if sized else self.unsized_mask
+
 
 def _resolve_widgets(widgets):
     if widgets is None:
         return None
-    return [
+    return tuple(
         Widget[w] if isinstance(w, str) else w
         for w in widgets
-    ]
+    )
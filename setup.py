@@ -6,8 +6,8 @@ from setuptools import setup, find_packages
 import versioneer
 
 
-if sys.version_info < (3, 4):
-    sys.stdout.write("At least Python 3.4 is required.\n")
+if sys.version_info < (3, 8):
+    sys.stdout.write("At least Python 3.8 is required.\n")
     sys.exit(1)
 
 
@@ -28,6 +28,10 @@ setup(
             'progressbar2=pokrok.plugins.progressbar2:Progressbar2ProgressMeterFactory',
             'halo=pokrok.plugins.halo:HaloProgressMeterFactory',
             'logging=pokrok.plugins.logging:LoggingProgressMeterFactory',
+            'ansi=pokrok.plugins.ansi:AnsiProgressMeterFactory',
+            'null=pokrok.plugins.null:NullProgressMeterFactory',
+            'metrics=pokrok.plugins.metrics:MetricsProgressMeterFactory',
+            'statusfile=pokrok.plugins.statusfile:StatusFileProgressMeterFactory',
         ]
     },
     classifiers=[
@@ -38,8 +42,9 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Natural Language :: English",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.4",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6"
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11"
     ]
 )
@@ -0,0 +1,74 @@
+import time
+
+import pytest
+
+import pokrok
+from pokrok.plugins import BaseProgressMeter, DefaultProgressMeterFactory, Status
+
+
+class RecordingProgressMeter(BaseProgressMeter):
+    """Progress meter that records its increments.
+    """
+    __slots__ = ('desc', 'increments')
+
+    def __init__(
+            self, mod, size, widgets, desc=None, start=None, unit=None,
+            multiplier=None, **_):
+        super().__init__(size, start, multiplier)
+        self.desc = desc
+        self.increments = []
+
+    def reset(self, size=None, desc=None, start=None, multiplier=None):
+        self._reset(size, start, multiplier)
+        self.desc = desc
+        self.increments = []
+
+    def increment(self, n=1):
+        self._check_status(Status.STARTED)
+        if self.multiplier:
+            n *= self.multiplier
+        self.count += n
+        self.increments.append(n)
+
+
+class RecordingProgressMeterFactory(DefaultProgressMeterFactory):
+    """Plugin that keeps a list of the progress meters it creates.
+    """
+    def __init__(self):
+        super().__init__(
+            'recording', self._create_meter, None, module_name='sys')
+        self.meters = []
+
+    def _create_meter(self, **kwargs):
+        meter = RecordingProgressMeter(**kwargs)
+        self.meters.append(meter)
+        return meter
+
+
+@pytest.fixture
+def recording(monkeypatch):
+    """Replaces the global ProgressFactory with one whose only plugin is a
+    RecordingProgressMeterFactory, and returns the plugin.
+    """
+    factory = pokrok.ProgressFactory()
+    factory.configure(plugin_names=['ansi'], exclusive=True, interactive=True)
+    plugin = RecordingProgressMeterFactory()
+    factory.plugins.plugins = {plugin.name: plugin}
+    factory.plugins.clear_cache()
+    monkeypatch.setattr(pokrok, '_FACTORY', factory)
+    return plugin
+
+
+def _wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def wait_for():
+    """Returns a function that polls `condition` until it is true, failing
+    the test if it is still false after `timeout` seconds.
+    """
+    return _wait_for
@@ -0,0 +1,67 @@
+import pytest
+
+import pokrok as pk
+
+
+@pytest.mark.parametrize('args', [
+    (10,), (0, 10, 3), (10, 0, -3), (10, 0, -1), (5, 5), (0, -10, -7)])
+def test_progress_range(recording, args):
+    expected = range(*args)
+    assert list(pk.progress_range(*args)) == list(expected)
+    meter, = recording.meters
+    assert meter.size == len(expected)
+    assert meter.count == len(expected)
+    assert meter.status.name == 'FINISHED'
+
+
+def test_progress_range_stopped_early(recording):
+    for i in pk.progress_range(100000):
+        if i == 54321:
+            break
+    assert recording.meters[0].count == 54321
+
+
+@pytest.mark.parametrize('batch_size', [1, 3, 10, 11])
+def test_progress_batches(recording, batch_size):
+    items = list(range(10))
+    batches = list(pk.progress_batches(items, batch_size))
+    assert batches == [
+        items[i:i + batch_size] for i in range(0, 10, batch_size)]
+    assert all(len(batch) == batch_size for batch in batches[:-1])
+    meter, = recording.meters
+    # The size and count are in items, with one increment per batch
+    assert meter.size == 10
+    assert meter.count == 10
+    assert meter.increments == [len(batch) for batch in batches]
+    assert meter.status.name == 'FINISHED'
+
+
+def test_progress_batches_container(recording):
+    batches = list(pk.progress_batches(iter(range(7)), 3, container=tuple))
+    assert batches == [(0, 1, 2), (3, 4, 5), (6,)]
+    meter, = recording.meters
+    assert meter.size is None
+    assert meter.increments == [3, 3, 1]
+
+
+def test_progress_batches_size(recording):
+    batches = pk.progress_batches(iter(range(7)), 2, size=7)
+    assert next(batches) == [0, 1]
+    meter, = recording.meters
+    assert meter.size == 7
+    assert meter.count == 0
+    assert list(batches) == [[2, 3], [4, 5], [6]]
+    assert meter.count == 7
+
+
+def test_progress_batches_invalid_batch_size(recording):
+    with pytest.raises(ValueError):
+        list(pk.progress_batches([1], 0))
+
+
+def test_progress_batches_disabled(monkeypatch):
+    factory = pk.ProgressFactory()
+    factory.configure(plugin_names=['null'])
+    monkeypatch.setattr(pk, '_FACTORY', factory)
+    assert list(pk.progress_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert factory.plugins.plugins is None
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+
+import pokrok as pk
+
+
+async def arange(n):
+    for i in range(n):
+        yield i
+
+
+def test_progress_aiter(recording):
+    async def main():
+        return [item async for item in pk.progress_aiter(arange(100), size=100)]
+
+    assert asyncio.run(main()) == list(range(100))
+    meter, = recording.meters
+    assert meter.count == 100
+    assert meter.size == 100
+    assert meter.status.name == 'FINISHED'
+
+
+def test_progress_aiter_creates_meter_off_loop(recording, monkeypatch):
+    threads = []
+    create = recording.create
+
+    def record_thread(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return create(*args, **kwargs)
+
+    monkeypatch.setattr(recording, 'create', record_thread)
+
+    async def main():
+        async for _ in pk.progress_aiter(arange(3)):
+            pass
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(main())
+    assert threads and loop_thread not in threads
+    assert recording.meters[0].count == 3
+
+
+def test_async_context_manager(recording):
+    async def main():
+        async with pk.progress_meter(size=10, thread_safe=True) as meter:
+            await asyncio.gather(*(
+                asyncio.to_thread(meter.increment) for _ in range(10)))
+        return meter
+
+    meter = asyncio.run(main())
+    assert meter.status.name == 'FINISHED'
+    assert recording.meters[0].count == 10
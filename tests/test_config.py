@@ -0,0 +1,86 @@
+import json
+import os
+
+import pytest
+
+import pokrok as pk
+from pokrok.plugins import PluginManager
+
+
+@pytest.mark.parametrize('options', [
+    {'size': 10},
+    {'widgets': None, 'desc': 'x'},
+    {'mininterval': -1},
+    {'mininterval': '0.1'},
+    {'miniters': 0},
+    {'miniters': 1.5},
+    ['desc'],
+])
+def test_invalid_plugin_options(options):
+    plugins = PluginManager()
+    with pytest.raises(ValueError):
+        plugins.set_plugin_options(tqdm=options)
+    with pytest.raises(ValueError):
+        plugins.set_plugin_options({'plugins': {'tqdm': options}})
+    assert 'tqdm' not in plugins.plugin_options
+
+
+def test_invalid_plugins_entry():
+    with pytest.raises(ValueError):
+        PluginManager().set_plugin_options({'plugins': ['tqdm']})
+
+
+def test_plugin_options_are_merged():
+    plugins = PluginManager()
+    plugins.set_plugin_options(tqdm={'mininterval': 0.5, 'miniters': 10})
+    plugins.set_plugin_options(tqdm={'miniters': 20}, halo={'spinner': 'dots'})
+    assert dict(plugins.plugin_options['tqdm']) == {
+        'mininterval': 0.5, 'miniters': 20}
+    assert dict(plugins.plugin_options['halo']) == {'spinner': 'dots'}
+
+
+def write_config(path, config):
+    with open(str(path), 'wt') as out:
+        json.dump(config, out)
+    return str(path)
+
+
+def test_file_options_override_keyword_options(recording, tmp_path):
+    filename = write_config(
+        tmp_path / 'pokrok.json',
+        {'plugins': {'recording': {'desc': 'file'}}})
+    pk.configure(filename=filename, recording={'desc': 'keyword', 'unit': 'x'})
+    assert dict(recording.options) == {'desc': 'file', 'unit': 'x'}
+
+
+def test_call_arguments_override_configured_options(recording):
+    pk.configure(recording={'desc': 'configured'})
+    with pk.progress_meter(desc='call') as meter:
+        pass
+    with pk.progress_meter() as default:
+        pass
+    assert meter.desc == 'call'
+    assert default.desc == 'configured'
+
+
+def test_config_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(pk, '_CONFIG_CACHE', {})
+    path = tmp_path / 'pokrok.json'
+    filename = write_config(path, {'pool_size': 1})
+    first = pk._read_config(filename)
+    assert first == {'pool_size': 1}
+    # The parsed configuration is reused while the file is unchanged
+    assert pk._read_config(filename) is first
+    # A change in size or modification time invalidates it
+    write_config(path, {'pool_size': 10})
+    assert pk._read_config(filename) == {'pool_size': 10}
+    write_config(path, {'pool_size': 20})
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert pk._read_config(filename) == {'pool_size': 20}
+
+
+def test_missing_config_file(tmp_path):
+    assert pk._read_config(str(tmp_path / 'missing.json')) is None
+    with pytest.raises(ValueError):
+        pk.ProgressFactory().configure(filename=str(tmp_path / 'missing.json'))
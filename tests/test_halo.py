@@ -0,0 +1,94 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pokrok.plugins import halo
+
+
+class Halo:
+    """Stand-in for halo.Halo that counts the frames it draws."""
+    _interval = 10
+    enabled = True
+
+    def __init__(self, text=''):
+        self.text = text
+        self.frames = 0
+        self.started = False
+        self.succeeded = False
+
+    def _check_stream(self):
+        return True
+
+    def _hide_cursor(self):
+        pass
+
+    def _render_frame(self):
+        self.frames += 1
+
+    def start(self):
+        self.started = True
+
+    def succeed(self):
+        self.succeeded = True
+
+
+def without(missing):
+    """Returns a Halo class that lacks the member `missing`."""
+    class OldHalo(Halo):
+        def __getattribute__(self, name):
+            if name == missing:
+                raise AttributeError(name)
+            return super().__getattribute__(name)
+
+    return OldHalo
+
+
+def create(cls=Halo, **kwargs):
+    mod = SimpleNamespace(Halo=cls)
+    return halo.HaloProgressMeter(mod, None, None, None, 0, None, None, **kwargs)
+
+
+def test_spinners_share_render_scheduler(wait_for):
+    first = create()
+    second = create()
+    with first:
+        with second:
+            assert first._scheduler is second._scheduler
+            assert first._scheduler is halo.get_scheduler(Halo._interval)
+            frames = first.spinner.frames
+            wait_for(lambda: second.spinner.frames > 3)
+            # Only the most recently started spinner is drawn
+            assert first.spinner.frames == frames
+        wait_for(lambda: first.spinner.frames > frames)
+    assert first.spinner.succeeded and second.spinner.succeeded
+    assert not halo._ACTIVE
+    wait_for(lambda: first._scheduler is None and
+             halo.get_scheduler(Halo._interval)._thread is None)
+
+
+def test_cooperative_spinner():
+    meter = create(cooperative=True)
+    with meter:
+        assert meter.spinner.frames == 1
+        meter.increment()
+        assert meter.spinner.frames == 1
+        time.sleep(0.02)
+        meter.increment()
+        assert meter.spinner.frames == 2
+    assert meter._scheduler is None
+    assert meter.count == 2
+
+
+@pytest.mark.parametrize('missing', halo._HALO_INTERNALS)
+@pytest.mark.parametrize('cooperative', [False, True])
+def test_spinner_without_halo_internals(missing, cooperative):
+    meter = create(without(missing), cooperative=cooperative)
+    with meter:
+        assert meter.spinner.started
+        assert meter._scheduler is None
+        time.sleep(0.02)
+        meter.increment()
+    assert meter.spinner.frames == 0
+    assert meter.count == 1
+    assert meter.spinner.succeeded
@@ -0,0 +1,52 @@
+"""Importing pokrok must stay cheap, since many programs import it but never
+show a progress meter.
+"""
+import compileall
+import os
+import subprocess
+import sys
+
+import pokrok
+
+
+IMPORT_TIME_BUDGET_US = 10000
+"""Maximum cumulative time of 'import pokrok', in microseconds."""
+
+FORBIDDEN_IMPORTS = ('pokrok.plugins', 'json', 'threading')
+"""Modules (and their submodules) that 'import pokrok' must not import."""
+
+
+def _import_pokrok():
+    """Imports pokrok in a new interpreter, and returns the (name, cumulative
+    microseconds) of each module imported by 'import pokrok'.
+    """
+    package_dir = os.path.dirname(pokrok.__file__)
+    # Don't measure the time to compile the module
+    compileall.compile_dir(package_dir, quiet=1)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import pokrok'],
+        cwd=os.path.dirname(package_dir), stderr=subprocess.PIPE,
+        universal_newlines=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if cumulative.strip().isdigit():
+                rows.append((name.rstrip(), int(cumulative)))
+    # Modules are listed after the modules they import, indented by level
+    end = max(i for i, (name, _) in enumerate(rows) if name == ' pokrok')
+    start = end
+    while start > 0 and rows[start - 1][0].startswith('   '):
+        start -= 1
+    return [(name.strip(), us) for name, us in rows[start:end + 1]]
+
+
+def test_import_is_lightweight():
+    imported = _import_pokrok()
+    names = [name for name, _ in imported]
+    assert names[-1] == 'pokrok'
+    for name in names:
+        assert not any(
+            name == forbidden or name.startswith(forbidden + '.')
+            for forbidden in FORBIDDEN_IMPORTS), name
+    assert imported[-1][1] < IMPORT_TIME_BUDGET_US
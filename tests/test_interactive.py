@@ -0,0 +1,44 @@
+import pytest
+
+import pokrok
+from pokrok.styles import Style, Widget
+
+
+@pytest.fixture
+def factory():
+    factory = pokrok.ProgressFactory()
+    factory.configure(
+        plugin_names=['ansi', 'logging'], exclusive=True, interactive=False)
+    return factory
+
+
+def test_switches_to_logging(factory):
+    meter = factory.create(size=10)
+    assert type(meter).__name__ == 'LoggingProgressMeter'
+    assert meter.interval_seconds == pokrok.NON_INTERACTIVE_OPTIONS['interval_seconds']
+
+
+def test_interactive_override(factory):
+    assert type(factory.create(size=10, interactive=True)).__name__ == 'AnsiProgressMeter'
+    assert type(factory.create(size=10, plugin_name='ansi')).__name__ == 'AnsiProgressMeter'
+
+
+def test_keeps_style_that_logging_cannot_provide(factory):
+    meter = factory.create(style=Style([Widget.SPINNER]))
+    assert type(meter).__name__ == 'AnsiProgressMeter'
+
+
+@pytest.mark.parametrize('options', [
+    dict(interval=2), dict(interval_seconds=3)])
+def test_configured_interval_is_used(factory, options):
+    factory.configure(logging=options)
+    meter = factory.create(size=10)
+    assert type(meter).__name__ == 'LoggingProgressMeter'
+    assert meter.interval_seconds == options.get('interval_seconds')
+    assert meter.interval == options.get('interval', 1000)
+
+
+def test_interval_argument_is_used(factory):
+    meter = factory.create(size=10, interval=5)
+    assert meter.interval_seconds is None
+    assert meter.interval == 5
@@ -0,0 +1,113 @@
+import pytest
+
+import pokrok as pk
+
+from pokrok.plugins import MAX_STRIDE, BaseProgressMeter, iterate_meter
+
+
+class RecordingMeter(BaseProgressMeter):
+    __slots__ = ('clock', 'updates')
+
+    def __init__(self, clock, size=None):
+        super().__init__(size)
+        self.clock = clock
+        self.updates = []
+
+    def increment(self, n=1):
+        self.count += n
+        self.updates.append((self.clock.now, self.count))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr('pokrok.plugins.time.monotonic', clock.monotonic)
+    return clock
+
+
+def generate(n):
+    yield from range(n)
+
+
+def as_list(n):
+    return list(range(n))
+
+
+def as_tuple(n):
+    return tuple(range(n))
+
+
+@pytest.mark.parametrize('source', [as_list, as_tuple, range, generate])
+def test_counts_all_items(clock, source):
+    meter = RecordingMeter(clock)
+    items = list(iterate_meter(meter, source(12345)))
+    assert items == list(range(12345))
+    assert meter.count == 12345
+    assert meter.status.name == 'FINISHED'
+
+
+@pytest.mark.parametrize('source', [as_list, generate])
+def test_counts_completed_items_when_stopped_early(clock, source):
+    meter = RecordingMeter(clock)
+    for i in iterate_meter(meter, source(10000)):
+        clock.now += 0.001
+        if i == 5000:
+            break
+    assert meter.count == 5000
+    assert meter.status.name == 'FINISHED'
+
+
+def test_includes_items_appended_to_list(clock):
+    meter = RecordingMeter(clock)
+    items = [0]
+    for i in iterate_meter(meter, items):
+        if i < 999:
+            items.append(i + 1)
+    assert meter.count == 1000
+
+
+@pytest.mark.parametrize('source', [as_list, range, generate])
+def test_updates_when_items_slow_down(clock, source):
+    # A fast phase grows the stride; after that, each item takes 1 ms
+    fast = 2000000
+    meter = RecordingMeter(clock)
+    for i in iterate_meter(meter, source(fast + 3000), mininterval=0.05):
+        clock.now += 1e-8 if i < fast else 0.001
+    times = [t for t, _ in meter.updates if t > fast * 1e-8]
+    gaps = [b - a for a, b in zip([fast * 1e-8] + times, times)]
+    assert len(times) > 2
+    assert max(gaps) <= MAX_STRIDE * 0.001 + 0.05
+
+
+def test_fixed_miniters(clock):
+    meter = RecordingMeter(clock)
+    for _ in iterate_meter(meter, generate(100), mininterval=0, miniters=10):
+        clock.now += 1
+    assert [count for _, count in meter.updates] == list(range(10, 101, 10))
+
+
+@pytest.mark.parametrize('source', [as_list, as_tuple, range, generate])
+def test_close_after_partial_consumption(clock, source):
+    meter = RecordingMeter(clock)
+    itr = iterate_meter(meter, source(3))
+    assert next(itr) == 0
+    assert next(itr) == 1
+    itr.close()
+    assert meter.count == 1
+    assert meter.status.name == 'FINISHED'
+
+
+def test_close_progress_range(recording):
+    itr = pk.progress_range(10)
+    assert next(itr) == 0
+    itr.close()
+    meter, = recording.meters
+    assert meter.status.name == 'FINISHED'
@@ -0,0 +1,135 @@
+import logging
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import pokrok.plugins.logging as pk_logging
+from pokrok.styles import Widget
+
+
+class Clock:
+    """Clock for the logging plugin that only advances when told to. It
+    starts at the real time, which is used for the start time of meters.
+    """
+    def __init__(self):
+        self.now = time.monotonic()
+
+    def monotonic(self):
+        return self.now
+
+
+class ListHandler(logging.Handler):
+    """Records each message, and the time of the clock when it was logged."""
+    def __init__(self, clock=None):
+        super().__init__()
+        self.clock = clock
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(
+            (self.clock.now if self.clock else None, record.getMessage()))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(
+        pk_logging, 'time', SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+@pytest.fixture
+def logger_name(request, clock):
+    name = 'pokrok-test-' + request.node.name
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    handler = ListHandler(clock)
+    logger.addHandler(handler)
+    yield name
+    logger.removeHandler(handler)
+
+
+def create(logger_name, size=None, **kwargs):
+    return pk_logging.LoggingProgressMeter(
+        logging, size, [Widget.COUNTER], logger_name=logger_name, **kwargs)
+
+
+def records(logger_name):
+    handler, = (
+        handler for handler in logging.getLogger(logger_name).handlers
+        if isinstance(handler, ListHandler))
+    return handler.records
+
+
+def test_count_interval(logger_name):
+    meter = create(logger_name, interval=1000)
+    with meter:
+        for _ in range(2500):
+            meter.increment()
+        # An increment past several multiples of the interval logs once, and
+        # the next message is at the next multiple
+        meter.increment(1700)
+        meter.increment(799)
+        assert meter._next_count == 5000
+        meter.increment()
+    messages = [message for _, message in records(logger_name)]
+    assert messages == [
+        '1000', '2000', '4200', '5000', 'Read a total of 5000 records']
+
+
+def test_count_interval_after_reset(logger_name):
+    meter = create(logger_name, interval=100)
+    with meter:
+        meter.increment(150)
+    meter.reset(start=50)
+    assert meter._next_count == 100
+    with meter:
+        meter.increment(50)
+    messages = [message for _, message in records(logger_name)]
+    assert messages == [
+        '150', 'Read a total of 150 records', '100',
+        'Read a total of 100 records']
+
+
+def test_time_interval_after_slowdown(logger_name, clock):
+    meter = create(logger_name, interval_seconds=10)
+    with meter:
+        # 100,000 items per second for 5 seconds, then 1 ms per item
+        for _ in range(500000):
+            clock.now += 0.00001
+            meter.increment()
+        for _ in range(100000):
+            clock.now += 0.001
+            meter.increment()
+    times = [now for now, _ in records(logger_name)]
+    assert len(times) >= 10
+    assert all(b - a <= 11 for a, b in zip(times, times[1:]))
+
+
+
+def test_asynchronous_messages_are_written_at_exit():
+    script = (
+        "import logging, sys, time\n"
+        "from pokrok.plugins.logging import LoggingProgressMeter\n"
+        "class SlowHandler(logging.StreamHandler):\n"
+        "    def emit(self, record):\n"
+        "        time.sleep(0.002)\n"
+        "        super().emit(record)\n"
+        "logging.getLogger('progress').addHandler(SlowHandler(sys.stdout))\n"
+        "meter = LoggingProgressMeter(\n"
+        "    logging, None, None, interval=1, asynchronous=True)\n"
+        "with meter:\n"
+        "    for _ in range(2000):\n"
+        "        meter.increment()\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True)
+    assert result.stderr == ''
+    lines = result.stdout.splitlines()
+    # Intermediate messages are dropped while the queue is full, but the
+    # final message is always written
+    assert len(lines) < 2001
+    assert lines[-1] == 'Read a total of 2000 records'
@@ -0,0 +1,57 @@
+"""Progress meters keep their state in __slots__, so that large numbers of
+concurrent progress meters fit in memory.
+"""
+import gc
+import tracemalloc
+
+import pytest
+
+from pokrok.plugins import ProgressMeter
+from pokrok.plugins.ansi import AnsiProgressMeterFactory
+from pokrok.plugins.logging import LoggingProgressMeterFactory
+import pokrok.plugins.halo
+import pokrok.plugins.metrics
+import pokrok.plugins.null
+import pokrok.plugins.progressbar2
+import pokrok.plugins.statusfile
+import pokrok.plugins.tqdm
+import pokrok.render
+import pokrok.shared
+
+
+METERS = 10000
+
+
+def _subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def test_progress_meters_have_no_instance_dict():
+    classes = [
+        cls for cls in _subclasses(ProgressMeter)
+        if cls.__module__.startswith('pokrok.')]
+    assert len(classes) >= 10
+    for cls in classes:
+        assert cls.__dictoffset__ == 0, cls
+
+
+@pytest.mark.parametrize('factory_class,max_bytes', [
+    (AnsiProgressMeterFactory, 256),
+    (LoggingProgressMeterFactory, 640),
+])
+def test_bytes_per_progress_meter(factory_class, max_bytes):
+    factory = factory_class()
+    # Don't count one-time allocations, e.g. importing the backend
+    factory.create(size=100, desc='task')
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        meters = [factory.create(size=100, desc='task') for _ in range(METERS)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(meters) == METERS
+    assert (after - before) / METERS <= max_bytes
@@ -0,0 +1,73 @@
+import os
+import threading
+import warnings
+
+from pokrok.plugins.metrics import MetricsExporter, MetricsProgressMeterFactory
+
+
+class Meter:
+    desc = 'task'
+    count = 1
+    size = None
+    start_time = None
+
+
+def test_render(tmp_path):
+    factory = MetricsProgressMeterFactory()
+    textfile = str(tmp_path / 'progress.prom')
+    with factory.create(size=10, desc='task "a"', textfile=textfile) as meter:
+        meter.increment(4)
+        text = meter._exporter.render()
+    assert 'pokrok_progress_count{slot="0",desc="task \\"a\\""} 4' in text
+    assert 'pokrok_progress_size{slot="0",desc="task \\"a\\""} 10' in text
+    text = meter._exporter.render()
+    assert 'pokrok_progress_finished{slot="0",desc="task \\"a\\""} 1' in text
+
+
+def test_max_meters():
+    exporter = MetricsExporter(max_meters=2)
+    slots = [exporter.add(Meter()) for _ in range(3)]
+    assert slots == [0, 1, None]
+    assert 'pokrok_progress_dropped_meters 1' in exporter.render()
+
+
+def test_writer_survives_write_errors(tmp_path, wait_for):
+    textfile = tmp_path / 'missing' / 'progress.prom'
+    exporter = MetricsExporter(textfile=str(textfile), interval=0.01)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        slot = exporter.add(Meter())
+        wait_for(lambda: caught)
+        assert exporter._writer.is_alive()
+        textfile.parent.mkdir()
+        wait_for(textfile.exists)
+        exporter.remove(slot)
+        wait_for(lambda: exporter._writer is None)
+    assert len(caught) == 1
+    assert 'pokrok_progress_count{slot="0",desc="task"} 1' in textfile.read_text()
+
+
+def test_concurrent_writers(tmp_path):
+    textfile = tmp_path / 'progress.prom'
+    exporters = [
+        MetricsExporter(textfile=str(textfile), max_meters=n)
+        for n in (1, 2)]
+    errors = []
+
+    def write(exporter):
+        try:
+            for _ in range(200):
+                exporter.write()
+        except OSError as err:
+            errors.append(err)
+
+    threads = [
+        threading.Thread(target=write, args=(exporter,))
+        for exporter in exporters]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert os.listdir(str(tmp_path)) == ['progress.prom']
+    assert textfile.stat().st_mode & 0o777 == 0o644
@@ -0,0 +1,106 @@
+import io
+import re
+
+import pytest
+
+import pokrok
+from pokrok.plugins.null import NULL_PROGRESS_METER
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    factory = pokrok.ProgressFactory()
+    monkeypatch.setattr(pokrok, '_FACTORY', factory)
+    return factory
+
+
+class FrameStream(io.StringIO):
+    """Stream that keeps each write (i.e. each frame) separately."""
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+
+    def write(self, text):
+        self.frames.append(text)
+        return super().write(text)
+
+
+def drawn_rows(frame):
+    """Returns the lines drawn by a frame."""
+    return re.findall('\r([^\r\x1b]*)\x1b\\[K', frame)
+
+
+def changed_rows(stream):
+    """Returns the lines drawn by each frame written since the last call."""
+    rows = [drawn_rows(frame) for frame in stream.frames]
+    del stream.frames[:]
+    return rows
+
+
+def test_rows(factory):
+    factory.configure(plugin_names=['ansi'], interactive=True)
+    stream = FrameStream()
+    with pokrok.MultiProgress(stream=stream, mininterval=0) as multi:
+        first = multi.add(size=10, desc='first', mininterval=0)
+        second = multi.add(size=10, desc='second', mininterval=0)
+        with first, second:
+            first.increment(5)
+            second.increment(4)
+            changed_rows(stream)
+            # Only the changed row is redrawn
+            first.increment(1)
+            (row,), = changed_rows(stream)
+            assert row.startswith('first') and '6/10' in row
+            second.increment(1)
+            (row,), = changed_rows(stream)
+            assert row.startswith('second') and '5/10' in row
+    assert multi.plugin_name == 'ansi'
+
+
+def test_rows_are_batched(factory):
+    factory.configure(plugin_names=['ansi'], interactive=True)
+    stream = FrameStream()
+    with pokrok.MultiProgress(stream=stream, mininterval=60) as multi:
+        meters = [
+            multi.add(size=10, desc=desc, mininterval=0)
+            for desc in ('first', 'second', 'third')]
+        for meter in meters:
+            meter.start()
+        multi.refresh()
+        changed_rows(stream)
+        meters[0].increment(2)
+        meters[2].increment(3)
+        meters[0].increment(1)
+        assert stream.frames == []
+        multi.refresh()
+        (first, third), = changed_rows(stream)
+        assert first.startswith('first') and '3/10' in first
+        assert third.startswith('third') and '3/10' in third
+        # Nothing is written if no row changed
+        multi.refresh()
+        assert stream.frames == []
+        for meter in meters:
+            meter.finish()
+
+
+def test_disabled(factory):
+    factory.configure(plugin_names=['null'])
+    stream = io.StringIO()
+    items = [1, 2, 3]
+    with pokrok.MultiProgress(stream=stream) as multi:
+        assert multi.add(size=10) is NULL_PROGRESS_METER
+        assert multi.iterate(items) is items
+    assert factory.plugins.plugins is None
+    assert stream.getvalue() == ''
+
+
+def test_not_interactive(recording):
+    pokrok._FACTORY.configure(interactive=False)
+    stream = io.StringIO()
+    with pokrok.MultiProgress(stream=stream) as multi:
+        assert multi.plugin_name is None
+        assert list(multi.iterate([1, 2, 3])) == [1, 2, 3]
+        with multi.add(size=10) as meter:
+            meter.increment()
+    assert [m.count for m in recording.meters] == [3, 1]
+    assert stream.getvalue() == ''
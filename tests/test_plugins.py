@@ -0,0 +1,89 @@
+import os
+import sys
+
+import pytest
+
+from pokrok import ProgressFactory
+import pokrok.plugins as plugins
+
+
+@pytest.fixture
+def broken_tqdm(tmp_path, monkeypatch):
+    # A backend that find_spec can locate but that fails to import
+    package = tmp_path / 'tqdm'
+    package.mkdir()
+    (package / '__init__.py').write_text('raise ImportError("broken install")\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in list(sys.modules):
+        if name == 'tqdm' or name.startswith('tqdm.'):
+            monkeypatch.delitem(sys.modules, name)
+
+
+def test_broken_backend_falls_back(broken_tqdm):
+    factory = ProgressFactory()
+    factory.configure(
+        plugin_names=['tqdm', 'ansi'], exclusive=True, interactive=True)
+    for _ in range(2):
+        meter = factory.create(size=10)
+        assert type(meter).__name__ == 'AnsiProgressMeter'
+    assert not factory.plugins.has_plugin('tqdm')
+
+
+def test_broken_backend_requested_explicitly(broken_tqdm):
+    factory = ProgressFactory()
+    factory.configure(
+        plugin_names=['tqdm', 'ansi'], exclusive=True, interactive=True)
+    with pytest.raises(ValueError):
+        factory.create(size=10, plugin_name='tqdm')
+
+
+ANSI_ENTRY_POINT = ('ansi', 'pokrok.plugins.ansi:AnsiProgressMeterFactory')
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Counts the scans of the installed distributions' entry points."""
+    calls = []
+    scan = plugins._scan_entry_points
+
+    def counting_scan(group):
+        calls.append(group)
+        return scan(group)
+
+    monkeypatch.setattr(plugins, '_scan_entry_points', counting_scan)
+    return calls
+
+
+def test_entry_point_cache_hit(tmp_path, scans):
+    cache_path = str(tmp_path / 'cache' / 'plugins.json')
+    entry_points = plugins.find_entry_points(cache_path=cache_path)
+    assert ANSI_ENTRY_POINT in entry_points
+    assert plugins.find_entry_points(cache_path=cache_path) == entry_points
+    assert len(scans) == 1
+
+
+def test_entry_point_cache_invalidated(tmp_path, monkeypatch, scans):
+    site = tmp_path / 'site'
+    site.mkdir()
+    monkeypatch.syspath_prepend(str(site))
+    cache_path = str(tmp_path / 'plugins.json')
+    entry_points = plugins.find_entry_points(cache_path=cache_path)
+    # Installing a distribution changes the fingerprint
+    (site / 'example-1.0.dist-info').mkdir()
+    assert plugins.find_entry_points(cache_path=cache_path) == entry_points
+    assert len(scans) == 2
+    assert plugins.find_entry_points(cache_path=cache_path) == entry_points
+    assert len(scans) == 2
+
+
+@pytest.mark.parametrize('content', ['{not json', '[]', '{"pokrok": 1}'])
+def test_corrupt_entry_point_cache(tmp_path, scans, content):
+    cache = tmp_path / 'plugins.json'
+    cache.write_text(content)
+    entry_points = plugins.find_entry_points(cache_path=str(cache))
+    assert ANSI_ENTRY_POINT in entry_points
+    assert len(scans) == 1
+    # The cache is rewritten
+    assert plugins.find_entry_points(cache_path=str(cache)) == entry_points
+    assert len(scans) == 1
+    assert os.listdir(str(tmp_path)) == ['plugins.json']
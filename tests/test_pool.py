@@ -0,0 +1,71 @@
+import pytest
+
+import pokrok as pk
+from pokrok.plugins import ProgressMeterPool
+
+
+def test_finished_meters_are_reused(recording):
+    pk.configure(pool_size=2)
+    assert list(pk.progress_iter([1, 2, 3], desc='first')) == [1, 2, 3]
+    assert list(pk.progress_iter([4, 5], desc='second')) == [4, 5]
+    meter, = recording.meters
+    assert meter.desc == 'second'
+    assert meter.size == 2
+    assert meter.count == 2
+    assert meter.status.name == 'FINISHED'
+
+
+def test_active_meters_are_not_reused(recording):
+    pk.configure(pool_size=2)
+    with pk.progress_meter(size=10) as first:
+        with pk.progress_meter(size=10) as second:
+            assert second is not first
+    with pk.progress_meter(size=10) as third:
+        assert third in (first, second)
+    assert len(recording.meters) == 2
+
+
+def test_meters_with_different_arguments_are_not_reused(recording):
+    pk.configure(pool_size=2)
+    with pk.progress_meter(size=10, unit='B'):
+        pass
+    with pk.progress_meter(size=10, unit='items'):
+        pass
+    with pk.progress_meter():
+        pass
+    assert len(recording.meters) == 3
+
+
+def test_reset(recording):
+    with pk.progress_meter(size=10, start=2, multiplier=2) as meter:
+        meter.increment(3)
+    assert meter.count == 8
+    meter.reset(size=5, desc='again', start=1)
+    assert meter.status.name == 'UNSTARTED'
+    assert (meter.size, meter.desc, meter.count, meter.multiplier) == (
+        5, 'again', 1, None)
+    with meter:
+        meter.increment()
+    assert meter.count == 2
+
+
+def test_pool_size_is_bounded(recording):
+    pool = ProgressMeterPool(maxsize=1)
+    plugin = recording
+    meters = [plugin.create(size=1) for _ in range(3)]
+    for meter in meters:
+        assert pool.track(meter, 'key')
+        meter.start()
+    for meter in meters:
+        meter.finish()
+    assert pool.acquire('key') is meters[0]
+    assert pool.acquire('key') is None
+
+
+def test_tqdm_meters_are_not_pooled():
+    pytest.importorskip('tqdm')
+    from pokrok.plugins.tqdm import TqdmProgressMeterFactory
+    meter = TqdmProgressMeterFactory().create(size=1)
+    assert not ProgressMeterPool().track(meter, 'key')
+    meter.start()
+    meter.finish()
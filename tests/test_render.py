@@ -0,0 +1,80 @@
+import threading
+
+import pokrok as pk
+from pokrok.render import (
+    DeferredProgressMeter, RenderScheduler, ThreadSafeProgressMeter)
+
+
+def test_deferred_meter_is_rendered_in_background(recording, wait_for):
+    scheduler = RenderScheduler(100)
+    meter = DeferredProgressMeter(recording.create(size=10), scheduler)
+    with meter:
+        meter.increment(3)
+        assert meter.meter.count == 0
+        wait_for(lambda: meter.meter.count == 3)
+        meter.increment(4)
+    assert meter.meter.count == 7
+    assert meter.meter.status.name == 'FINISHED'
+    wait_for(lambda: scheduler._thread is None)
+
+
+def test_broken_meter_does_not_stop_rendering(recording, wait_for):
+    class BrokenMeter:
+        def render(self):
+            raise RuntimeError()
+
+    scheduler = RenderScheduler(100)
+    broken = BrokenMeter()
+    scheduler.add(broken)
+    meter = DeferredProgressMeter(recording.create(), scheduler)
+    with meter:
+        meter.increment()
+        wait_for(lambda: meter.meter.count == 1)
+        assert broken not in scheduler._meters
+
+
+def test_frame_rate(recording):
+    pk.configure(frame_rate=50)
+    with pk.progress_meter(size=100) as meter:
+        assert isinstance(meter, DeferredProgressMeter)
+        for _ in range(100):
+            meter.increment()
+    assert list(pk.progress_iter(range(1000))) == list(range(1000))
+    first, second = recording.meters
+    assert first.count == 100
+    assert second.count == 1000
+
+
+def test_thread_safe_meter_counts_all_threads(recording, wait_for):
+    def work():
+        for _ in range(20000):
+            meter.increment()
+
+    pk.configure(frame_rate=200)
+    with pk.progress_meter(size=160000, thread_safe=True) as meter:
+        assert isinstance(meter, ThreadSafeProgressMeter)
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        # The counts of threads that have exited are kept
+        for thread in threads:
+            thread.join()
+        assert meter.count == 160000
+        wait_for(lambda: meter.meter.count == 160000)
+        meter.increment(5)
+    assert meter.meter.count == 160005
+    assert meter.meter.status.name == 'FINISHED'
+
+
+def test_thread_safe_meter_reset(recording):
+    scheduler = RenderScheduler(100)
+    meter = ThreadSafeProgressMeter(recording.create(size=10), scheduler)
+    with meter:
+        meter.increment(3)
+    meter.reset(size=20)
+    assert meter.count == 0
+    with meter:
+        thread = threading.Thread(target=meter.increment, args=(4,))
+        thread.start()
+        thread.join()
+    assert meter.meter.count == 4
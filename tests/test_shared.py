@@ -0,0 +1,76 @@
+import multiprocessing
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from pokrok.plugins import ProgressMeterError
+from pokrok.shared import SharedProgress
+
+
+def init_worker(handle):
+    global counter
+    counter = handle
+
+
+def work(n):
+    for _ in range(n):
+        counter.increment()
+    return counter.slot
+
+
+@pytest.mark.parametrize('method', ['fork', 'spawn'])
+def test_pool_workers_share_slots(recording, method):
+    if method not in multiprocessing.get_all_start_methods():
+        pytest.skip()
+    context = multiprocessing.get_context(method)
+    chunks = [10] * 200
+    with SharedProgress(size=sum(chunks) + 5, slots=4, mp_context=context) as progress:
+        handle = progress.handle()
+        # The parent claims its own slot, which forked workers must not reuse
+        handle.increment(5)
+        with context.Pool(
+                3, initializer=init_worker, initargs=(handle,)) as pool:
+            slots = set(pool.map(work, chunks))
+        assert handle.slot not in slots
+        assert len(slots) <= 3
+        handle.close()
+    meter, = recording.meters
+    assert meter.count == sum(chunks) + 5
+    assert meter.status.name == 'FINISHED'
+
+
+def test_all_slots_in_use(recording):
+    with SharedProgress(slots=1) as progress:
+        first = progress.handle()
+        first.increment()
+        second = progress.handle()
+        with pytest.raises(ProgressMeterError):
+            second.increment()
+        progress.increment(2)
+        first.increment()
+        assert progress.count == 4
+        first.close()
+    assert recording.meters[0].count == 4
+
+
+def test_handle_is_not_passed_with_tasks(recording):
+    with SharedProgress() as progress:
+        with pytest.raises(RuntimeError):
+            pickle.dumps(progress.handle())
+
+
+def test_handle_is_detached_at_exit():
+    script = (
+        "import pokrok as pk\n"
+        "pk.configure(plugin_names=['null'], exclusive=True)\n"
+        "handle = None\n"
+        "with pk.SharedProgress() as progress:\n"
+        "    handle = progress.handle()\n"
+        "    handle.increment()\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True)
+    assert result.returncode == 0
+    assert result.stderr == ''
@@ -0,0 +1,59 @@
+import json
+import os
+import threading
+import warnings
+
+from pokrok.plugins.statusfile import StatusFileProgressMeterFactory
+
+
+def test_status_file(tmp_path):
+    path = tmp_path / 'status.json'
+    factory = StatusFileProgressMeterFactory()
+    with factory.create(size=10, desc='task', path=str(path), fsync=False) as meter:
+        status = json.loads(path.read_text())
+        assert (status['desc'], status['count'], status['status']) == (
+            'task', 0, 'STARTED')
+        meter.increment(3)
+    status = json.loads(path.read_text())
+    assert (status['count'], status['size'], status['status']) == (
+        3, 10, 'FINISHED')
+    assert os.listdir(str(tmp_path)) == ['status.json']
+
+
+def test_concurrent_meters(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    factory = StatusFileProgressMeterFactory()
+    errors = []
+
+    def work():
+        try:
+            with factory.create(size=2000, interval=0, fsync=False) as meter:
+                for _ in range(2000):
+                    meter.increment()
+        except Exception as err:
+            errors.append(err)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert errors == []
+    names = sorted(os.listdir(str(tmp_path)))
+    assert len(names) == 4
+    for name in names:
+        assert json.loads((tmp_path / name).read_text())['count'] == 2000
+
+
+def test_write_errors_are_not_raised(tmp_path):
+    path = tmp_path / 'missing' / 'status.json'
+    factory = StatusFileProgressMeterFactory()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        with factory.create(size=10, path=str(path), interval=0) as meter:
+            meter.increment()
+            meter.increment()
+    assert len(caught) == 1
+    assert issubclass(caught[0].category, RuntimeWarning)